@@ -2,12 +2,25 @@ from __future__ import annotations
 from datetime import date, time
 
 
+# Günün her dakikası için 1 bit: DT dakikaları 1 (07:00–10:00, 17:00–20:00; bitiş hariç)
+_DT_MASK = 0
+for _m in (*range(7 * 60, 10 * 60), *range(17 * 60, 20 * 60)):
+    _DT_MASK |= 1 << _m
+del _m
+
+# Tüm değer kümesi (1440 dakika) önceden hesaplanmış sonuç tablosu
+_DT_ODT_BY_MINUTE = tuple(("ODT", "DT")[(_DT_MASK >> _i) & 1] for _i in range(24 * 60))
+
+
 def classify_dt_odt(t: time) -> str:
     """DT: 07:00–10:00 ve 17:00–20:00 (sınırlar dahil)."""
-    mins = t.hour * 60 + t.minute
-    dt1 = 7 * 60 <= mins < 10 * 60
-    dt2 = 17 * 60 <= mins < 20 * 60
-    return "DT" if (dt1 or dt2) else "ODT"
+    return _DT_ODT_BY_MINUTE[t.hour * 60 + t.minute]
+
+
+def dt_odt_by_minute(minute_of_day: int) -> str:
+    """Gün içi dakika (0–1439) -> DT/ODT. Grid satırı gibi dakikası hazır olan yerler için
+    (time nesnesi üretmeden) doğrudan tablo okuması."""
+    return _DT_ODT_BY_MINUTE[minute_of_day]
 
 
 def validate_day(plan_date: date) -> tuple[bool, str]:
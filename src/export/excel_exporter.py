@@ -18,7 +18,7 @@ from openpyxl.utils import get_column_letter, column_index_from_string
 from collections import Counter
 from openpyxl import Workbook
 
-from src.domain.time_rules import classify_dt_odt
+from src.domain.time_rules import dt_odt_by_minute
 
 TR_DOW = ["Pt", "Sa", "Çr", "Pş", "Cu", "Ct", "Pa"]  # Monday=0
 
@@ -134,10 +134,15 @@ def _row_idx_to_time(row_idx: int) -> time:
     """Grid satırı -> kuşak başlangıç saati.
     Şablon: 07:00-20:00, 15dk.
     """
-    mins = 7 * 60 + int(row_idx) * 15
+    mins = _row_idx_to_minute(row_idx)
     return time(mins // 60, mins % 60)
 
 
+def _row_idx_to_minute(row_idx: int) -> int:
+    """Grid satırı -> gün içi dakika (07:00 + 15dk * satır)."""
+    return 7 * 60 + int(row_idx) * 15
+
+
 def _norm_hour_label(label: str) -> str:
     """Saat etiketini tek formata indirger.
 
@@ -235,8 +240,7 @@ def _fill_unit_prices_span_sheet(ws, payload: dict, chunk_start: date) -> None:
     odt_price = _to_float(mp.get("odt") if mp.get("odt") is not None else payload.get("channel_price_odt"))
 
     for r in range(8, 60):
-        t0 = _row_idx_to_time(r - 8)
-        band = classify_dt_odt(t0)
+        band = dt_odt_by_minute(_row_idx_to_minute(r - 8))
         ws[f"AP{r}"].value = dt_price if band == "DT" else odt_price
 
 
@@ -420,7 +424,7 @@ def export_excel(template_path: Path, out_path: Path, payload: dict[str, Any]) -
                         ws.cell(rr, col).fill = disabled_fill
                     continue
 
-                slot_type = classify_dt_odt(_row_idx_to_time(row_idx))
+                slot_type = dt_odt_by_minute(_row_idx_to_minute(row_idx))
                 if is_weekend:
                     gf2 = dt_weekend_fill if slot_type == "DT" else odt_weekend_fill
                 else:
@@ -535,7 +539,7 @@ def export_excel(template_path: Path, out_path: Path, payload: dict[str, Any]) -
 
     for row_idx in range(GRID_ROWS):
         rr = GRID_START_ROW + row_idx
-        slot_type = classify_dt_odt(_row_idx_to_time(row_idx))
+        slot_type = dt_odt_by_minute(_row_idx_to_minute(row_idx))
         val = dt_price if slot_type == "DT" else odt_price
         try:
             ws.cell(rr, unit_price_col).value = val
@@ -850,7 +854,7 @@ def _export_excel_span_legacy(
                 # grid fill
                 for row_idx in range(0, GRID_ROWS):
                     rr = GRID_START_ROW + row_idx
-                    slot_type = classify_dt_odt(_row_idx_to_time(row_idx))
+                    slot_type = dt_odt_by_minute(_row_idx_to_minute(row_idx))
                     if is_weekend:
                         gf2 = dt_weekend_fill if slot_type == "DT" else odt_weekend_fill
                     else:
@@ -995,7 +999,7 @@ def _export_excel_span_legacy(
 
                 for row_idx in range(GRID_ROWS):
                     rr = GRID_START_ROW + row_idx
-                    slot_type = classify_dt_odt(_row_idx_to_time(row_idx))
+                    slot_type = dt_odt_by_minute(_row_idx_to_minute(row_idx))
                     ws.cell(rr, unit_price_col).value = dt_price if slot_type == "DT" else odt_price
             except Exception:
                 pass
@@ -1345,7 +1349,7 @@ def export_excel_span(template_path: Path, out_path: Path, payload: dict, month_
         unit_price_col = column_index_from_string("AO")
         for row_idx in range(52):
             rr = GRID_ROW_START + row_idx
-            slot_type = classify_dt_odt(_row_idx_to_time(row_idx))
+            slot_type = dt_odt_by_minute(_row_idx_to_minute(row_idx))
             ws.cell(rr, unit_price_col).value = dt_price if slot_type == "DT" else odt_price
 
     def _fill_code_summary(ws) -> None:
@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import Any
 
 from src.domain.models import ReservationDraft, ConfirmedReservation
-from src.domain.time_rules import classify_dt_odt, validate_day
+from src.domain.time_rules import classify_dt_odt, dt_odt_by_minute, validate_day
 
 from src.storage.repository import Repository
 
@@ -35,18 +35,24 @@ class ReservationService:
 
         Şablon: 07:00-20:00, 15dk adım.
         """
-        mins = 7 * 60 + int(row_idx) * 15
+        mins = self._row_idx_to_minute(row_idx)
         return time(mins // 60, mins % 60)
+
+    @staticmethod
+    def _row_idx_to_minute(row_idx: int) -> int:
+        """Plan grid satırı -> gün içi dakika (07:00 + 15dk * satır)."""
+        return 7 * 60 + int(row_idx) * 15
+
     def sanitize_plan_cells(self, plan_cells: dict) -> dict[str, str]:
-        fixed: dict[str, str] = {}
-        for k, v in (plan_cells or {}).items():
-            # tuple key’ler varsa “r,c” formatına çevir (exporter için stabil)
-            if isinstance(k, tuple) and len(k) == 2:
-                kk = f"{k[0]},{k[1]}"
-            else:
-                kk = str(k)
-            fixed[kk] = "" if v is None else str(v)
-        return fixed
+        cells = plan_cells or {}
+        # Hızlı yol: DB'den gelen payload zaten str->str; sadece kopyala
+        if all(type(k) is str and type(v) is str for k, v in cells.items()):
+            return dict(cells)
+        # tuple key’ler varsa “r,c” formatına çevir (exporter için stabil)
+        return {
+            (f"{k[0]},{k[1]}" if isinstance(k, tuple) and len(k) == 2 else str(k)): ("" if v is None else str(v))
+            for k, v in cells.items()
+        }
 
 
     def _parse_iso_date(self, s: Any) -> date | None:
@@ -262,23 +268,30 @@ class ReservationService:
         }
         return ConfirmedReservation(payload=payload)
 
-    def export_test(self, template_path: Path, out_dir: Path, confirmed: ConfirmedReservation) -> Path:
-        from src.export.excel_exporter import export_excel
-
+    def prepare_test_export(self, out_dir: Path, confirmed: ConfirmedReservation) -> tuple[Path, dict]:
+        """Test çıktısı için (out_path, payload) hazırla; Excel yazımı çağırana kalır."""
         out_dir.mkdir(parents=True, exist_ok=True)
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        ts = now.strftime("%Y%m%d_%H%M%S")
         out_path = out_dir / f"TEST_{ts}.xlsx"
 
         payload = confirmed.to_payload()
         payload["reservation_no"] = ""
-        payload["created_at"] = datetime.now().isoformat(timespec="seconds")
+        payload["created_at"] = now.isoformat(timespec="seconds")
+        return out_path, payload
 
+    def export_test(self, template_path: Path, out_dir: Path, confirmed: ConfirmedReservation) -> Path:
+        from src.export.excel_exporter import export_excel
+
+        out_path, payload = self.prepare_test_export(out_dir, confirmed)
         export_excel(template_path, out_path, payload)
         return out_path
 
-    def save_and_export(self, template_path: Path, out_dir: Path, confirmed: ConfirmedReservation) -> Path:
-        from src.export.excel_exporter import export_excel
+    def prepare_saved_export(self, out_dir: Path, confirmed: ConfirmedReservation) -> tuple[Path, dict]:
+        """Rezervasyonu DB'ye yazar ve çıktı için (out_path, payload) döndürür.
 
+        DB işi burada (çağıran thread'de) biter; Excel yazımı ayrı thread'de yapılabilir.
+        """
         payload = confirmed.to_payload()
 
         # repo create_reservation senin mevcut fonksiyon imzanla uyumlu olmalı:
@@ -292,10 +305,16 @@ class ReservationService:
         out_dir.mkdir(parents=True, exist_ok=True)
         out_path = out_dir / f"{rec.reservation_no}.xlsx"
 
-        payload2 = dict(rec.payload)
+        # to_payload() zaten kopya döndürüyor; rec.payload o kopyanın kendisi -> tekrar kopyalama
+        payload2 = rec.payload
         payload2["reservation_no"] = rec.reservation_no
         payload2["created_at"] = rec.created_at
+        return out_path, payload2
+
+    def save_and_export(self, template_path: Path, out_dir: Path, confirmed: ConfirmedReservation) -> Path:
+        from src.export.excel_exporter import export_excel
 
+        out_path, payload2 = self.prepare_saved_export(out_dir, confirmed)
         export_excel(template_path, out_path, payload2)
         return out_path
 
@@ -462,8 +481,9 @@ class ReservationService:
                 except Exception:
                     continue
 
-                t0 = self._row_idx_to_time(int(row_idx))
-                dt_odt = classify_dt_odt(t0)
+                mins = self._row_idx_to_minute(row_idx)
+                t0 = time(mins // 60, mins % 60)
+                dt_odt = dt_odt_by_minute(mins)
                 # span kayıtlarında fiyat ay bazlı değişebilir: repo fiyatını tercih et
                 ch_id = ch_id_map.get(channel_name.strip().lower())
                 cache_key = (adv_name.casefold(), int(yy))
@@ -752,8 +772,7 @@ class ReservationService:
                     continue
                 if day < 1 or day > days_in_month:
                     continue
-                t0 = self._row_idx_to_time(row_idx)
-                dt_odt = classify_dt_odt(t0)
+                dt_odt = dt_odt_by_minute(self._row_idx_to_minute(row_idx))
                 key = (channel_name, dt_odt, day)
                 counts[key] = int(counts.get(key, 0)) + 1
 
@@ -1115,8 +1134,7 @@ class ReservationService:
                     if dd not in date_set:
                         continue
 
-                    t0 = self._row_idx_to_time(row_idx)
-                    dt_odt = classify_dt_odt(t0)
+                    dt_odt = dt_odt_by_minute(self._row_idx_to_minute(row_idx))
                     key = (channel_norm, dt_odt, dd)
                     counts[key] = int(counts.get(key, 0)) + 1
 
@@ -94,6 +94,11 @@ ON reservations(plan_title, created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_reservations_is_confirmed_plan_title
 ON reservations(is_confirmed, plan_title);
 
+-- search_advertisers: onaylı kayıtlarda reklam veren adı üzerinde covering index
+-- (payload_json satırlarına inmeden tarar; ORDER BY/DISTINCT index sırasından gelir)
+CREATE INDEX IF NOT EXISTS idx_reservations_is_confirmed_advertiser
+ON reservations(is_confirmed, advertiser_name);
+
 CREATE INDEX IF NOT EXISTS idx_spotlist_status_res_day_row
 ON spotlist_status(reservation_id, day, row_idx);
 
@@ -103,8 +108,18 @@ def ensure_data_folders(data_dir: Path) -> None:
     data_dir.mkdir(parents=True, exist_ok=True)
     (data_dir / "exports").mkdir(parents=True, exist_ok=True)
 
+def _decode_json_column(raw: bytes) -> object:
+    # SQLite TEXT değeri converter'a bytes olarak gelir; json.loads bytes'ı doğrudan
+    # parse edebildiği için ara str decode adımına gerek yok.
+    return json.loads(raw or b"{}")
+
+
+# SELECT içinde `kolon AS "ad [JSON]"` yazılan kolonlar otomatik dict'e çevrilir.
+sqlite3.register_converter("JSON", _decode_json_column)
+
+
 def connect_db(db_path: Path) -> sqlite3.Connection:
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, detect_types=sqlite3.PARSE_COLNAMES)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys=ON")
     return conn
@@ -283,6 +298,10 @@ def migrate_and_seed(conn: sqlite3.Connection) -> None:
         "ALTER TABLE access_example_rows ADD COLUMN values_json TEXT NOT NULL DEFAULT '{}'",
         "values_json",
     )
+    # Erişim haritası tek kanal için okunur (set_id + büyük harf kanal adı)
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_access_rows_set_channel ON access_example_rows(set_id, UPPER(channel))"
+    )
 
     conn.execute(
         "CREATE INDEX IF NOT EXISTS idx_reservations_plan_title ON reservations(plan_title)"
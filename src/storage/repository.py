@@ -7,6 +7,20 @@ from datetime import datetime
 from typing import Any
 import re
 
+# Saat etiketi normalizasyonu (_norm_hour_label) için derlenmiş regex'ler
+_RE_HOUR_PAREN = re.compile(r"\([^\)]*\)\s*$")
+_RE_HOUR_DASH = re.compile(r"\s*-\s*")
+_RE_HOUR = re.compile(r"^(\d{1,2}):(\d{2})-(\d{1,2}):(\d{2})$")
+
+# payload_json / values_json: boşluksuz, UTF-8 olduğu gibi (plan_cells binlerce anahtar olabilir)
+_dump_json = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+# payload_json kolonu "[JSON]" converter'ı ile (bkz. storage.db) doğrudan dict olarak gelir.
+_RESERVATION_COLS = (
+    'id, reservation_no, advertiser_name, plan_title, created_at, is_confirmed, '
+    'payload_json AS "payload [JSON]"'
+)
+
 @dataclass
 class ReservationRecord:
     id: int
@@ -21,6 +35,19 @@ class Repository:
     def __init__(self, conn: sqlite3.Connection) -> None:
         self.conn = conn
 
+    @staticmethod
+    def _record_from_row(r: sqlite3.Row) -> ReservationRecord:
+        payload = r["payload"]
+        return ReservationRecord(
+            id=r["id"],
+            reservation_no=r["reservation_no"],
+            advertiser_name=r["advertiser_name"],
+            plan_title=(r["plan_title"] or str(payload.get("plan_title") or "")),
+            created_at=r["created_at"],
+            is_confirmed=r["is_confirmed"],
+            payload=payload,
+        )
+
     # -------------------------
     # Normalization helpers
     # -------------------------
@@ -47,10 +74,11 @@ class Repository:
         name = self._norm_name(name)
         if not name:
             return
-        name = self._resolve_advertiser_name(name)
+        # Büyük/küçük harf varyantı zaten kayıtlıysa ekleme (tek statement).
         self.conn.execute(
-            "INSERT OR IGNORE INTO advertisers(name) VALUES(?)",
-            (name,),
+            "INSERT OR IGNORE INTO advertisers(name) "
+            "SELECT ? WHERE NOT EXISTS (SELECT 1 FROM advertisers WHERE lower(name)=lower(?))",
+            (name, name),
         )
 
     def search_advertisers(self, text: str, limit: int = 30) -> list[str]:
@@ -155,8 +183,8 @@ class Repository:
     def list_confirmed_reservations_by_plan_title(self, plan_title: str, limit: int = 5000) -> list[ReservationRecord]:
         pt = (plan_title or "").strip()
         cur = self.conn.execute(
-            """
-            SELECT * FROM reservations
+            f"""
+            SELECT {_RESERVATION_COLS} FROM reservations
             WHERE plan_title = ? AND is_confirmed = 1
             ORDER BY datetime(created_at) DESC
             LIMIT ?
@@ -165,23 +193,36 @@ class Repository:
         )
         out: list[ReservationRecord] = []
         for r in cur.fetchall():
-            out.append(
-                ReservationRecord(
-                    id=r["id"],
-                    reservation_no=r["reservation_no"],
-                    advertiser_name=r["advertiser_name"],
-                    plan_title=(r["plan_title"] if "plan_title" in r.keys() else (json.loads(r["payload_json"] or "{}").get("plan_title") or "")),
-                    created_at=r["created_at"],
-                    is_confirmed=r["is_confirmed"],
-                    payload=json.loads(r["payload_json"]),
-                )
-            )
+            out.append(self._record_from_row(r))
         return out
 
+    def list_confirmed_reservations_filtered(
+        self, plan_title: str, year: int, month: int = 0, channel_name: str = ""
+    ) -> list[ReservationRecord]:
+        """REZERVASYONLAR sekmesi filtresi: plan başlığı + yıl/ay (+ kanal) SQL tarafında.
+
+        plan_date payload'da ISO (YYYY-MM-DD) tutulur; eşleşmeyen satırların payload'ı
+        Python'a taşınıp parse edilmez. month=0 / channel_name='' -> filtre yok.
+        """
+        pt = (plan_title or "").strip()
+        date_prefix = f"{int(year):04d}-{int(month):02d}-%" if month else f"{int(year):04d}-%"
+        ch = (channel_name or "").strip()
+        cur = self.conn.execute(
+            f"""
+            SELECT {_RESERVATION_COLS} FROM reservations
+            WHERE plan_title = ? AND is_confirmed = 1
+            AND json_extract(payload_json, '$.plan_date') LIKE ?
+            AND (? = '' OR TRIM(json_extract(payload_json, '$.channel_name')) = ?)
+            ORDER BY datetime(created_at) DESC
+            """,
+            (pt, date_prefix, ch, ch),
+        )
+        return [self._record_from_row(r) for r in cur.fetchall()]
+
     def list_reservations_by_advertiser(self, advertiser_name: str, limit: int = 50) -> list[ReservationRecord]:
         cur = self.conn.execute(
-            """
-            SELECT * FROM reservations
+            f"""
+            SELECT {_RESERVATION_COLS} FROM reservations
             WHERE advertiser_name = ?
             ORDER BY datetime(created_at) DESC
             LIMIT ?
@@ -190,17 +231,7 @@ class Repository:
         )
         out: list[ReservationRecord] = []
         for r in cur.fetchall():
-            out.append(
-                ReservationRecord(
-                    id=r["id"],
-                    reservation_no=r["reservation_no"],
-                    advertiser_name=r["advertiser_name"],
-                    plan_title=(r["plan_title"] if "plan_title" in r.keys() else (json.loads(r["payload_json"] or "{}").get("plan_title") or "")),
-                    created_at=r["created_at"],
-                    is_confirmed=r["is_confirmed"],
-                    payload=json.loads(r["payload_json"]),
-                )
-            )
+            out.append(self._record_from_row(r))
         return out
 
     def next_reservation_no(self, advertiser_name: str, when: datetime) -> str:
@@ -212,22 +243,16 @@ class Repository:
         year = when.isocalendar().year
         week = when.isocalendar().week
 
-        # Transaction içinde seq çek + arttır
-        cur = self.conn.execute("SELECT value FROM meta WHERE key=?", ("reservation_seq",))
-        row = cur.fetchone()
-        if row is None:
-            seq = 1000
-            self.conn.execute("INSERT INTO meta(key,value) VALUES(?,?)", ("reservation_seq", str(seq)))
-        else:
-            seq = int(row["value"])
+        # Transaction içinde seq çek + arttır (tek statement: yoksa 1000 ile başlat)
+        row = self.conn.execute(
+            "INSERT INTO meta(key, value) VALUES(?, '1001') "
+            "ON CONFLICT(key) DO UPDATE SET value=CAST(value AS INTEGER) + 1 "
+            "RETURNING CAST(value AS INTEGER) - 1 AS seq",
+            ("reservation_seq",),
+        ).fetchone()
+        seq = int(row["seq"])
 
         reservation_no = f"{first}-{year}W{week:02d}-{seq}"
-
-        # arttır
-        self.conn.execute(
-            "UPDATE meta SET value=? WHERE key=?",
-            (str(seq + 1), "reservation_seq"),
-        )
         return reservation_no
 
     def create_reservation(self, advertiser_name: str, payload: dict, confirmed: bool) -> ReservationRecord:
@@ -239,17 +264,16 @@ class Repository:
             if confirmed:
                 reservation_no = self.next_reservation_no(advertiser_name, datetime.now())
 
-            self.conn.execute(
+            rid = self.conn.execute(
                 """
                 INSERT INTO reservations(reservation_no, advertiser_name, plan_title, created_at, is_confirmed, payload_json)
                 VALUES(?, ?, ?, ?, ?, ?)
+                RETURNING id
                 """,
-                (reservation_no, advertiser_name, str(payload.get("plan_title") or "").strip(), now, 1 if confirmed else 0, json.dumps(payload, ensure_ascii=False)),
-            )
+                (reservation_no, advertiser_name, str(payload.get("plan_title") or "").strip(), now, 1 if confirmed else 0, _dump_json(payload)),
+            ).fetchone()["id"]
 
             self.upsert_advertiser(advertiser_name)
-
-            rid = self.conn.execute("SELECT last_insert_rowid() AS id").fetchone()["id"]
             self.conn.commit()
         except Exception:
             self.conn.rollback()
@@ -267,8 +291,8 @@ class Repository:
 
     def list_confirmed_reservations_by_advertiser(self, advertiser_name: str, limit: int = 5000):
         cur = self.conn.execute(
-            """
-            SELECT * FROM reservations
+            f"""
+            SELECT {_RESERVATION_COLS} FROM reservations
             WHERE advertiser_name = ? AND is_confirmed = 1
             ORDER BY datetime(created_at) DESC
             LIMIT ?
@@ -277,17 +301,7 @@ class Repository:
         )
         out = []
         for r in cur.fetchall():
-            out.append(
-                ReservationRecord(
-                    id=r["id"],
-                    reservation_no=r["reservation_no"],
-                    advertiser_name=r["advertiser_name"],
-                    plan_title=(r["plan_title"] if "plan_title" in r.keys() else (json.loads(r["payload_json"] or "{}").get("plan_title") or "")),
-                    created_at=r["created_at"],
-                    is_confirmed=r["is_confirmed"],
-                    payload=json.loads(r["payload_json"]),
-                )
-            )
+            out.append(self._record_from_row(r))
         return out
 
     def delete_reservations_by_ids(self, ids: list[int]) -> None:
@@ -336,7 +350,7 @@ class Repository:
         """Tek bir reservation kaydının payload_json alanını günceller."""
         self.conn.execute(
             "UPDATE reservations SET payload_json=? WHERE id=?",
-            (json.dumps(payload, ensure_ascii=False), int(reservation_id)),
+            (_dump_json(payload), int(reservation_id)),
         )
         self.conn.commit()
 
@@ -394,13 +408,13 @@ class Repository:
         """
         s = (label or "").strip()
         # sonda '(...)' varsa at
-        s = re.sub(r"\([^\)]*\)\s*$", "", s).strip()
+        s = _RE_HOUR_PAREN.sub("", s).strip()
         # unicode tireleri standart '-' yap
         s = s.replace("–", "-").replace("—", "-")
         # tire etrafındaki boşlukları temizle
-        s = re.sub(r"\s*-\s*", "-", s)
+        s = _RE_HOUR_DASH.sub("-", s)
 
-        m = re.match(r"^(\d{1,2}):(\d{2})-(\d{1,2}):(\d{2})$", s)
+        m = _RE_HOUR.match(s)
         if m:
             h1, m1, h2, m2 = (int(m.group(1)), int(m.group(2)), int(m.group(3)), int(m.group(4)))
             return f"{h1:02d}:{m1:02d}-{h2:02d}:{m2:02d}"
@@ -524,18 +538,21 @@ class Repository:
             )
             self.conn.execute("DELETE FROM access_example_rows WHERE set_id=?", (int(set_id),))
 
-            for i, r in enumerate(rows):
-                ch = (r.get("channel") or "").strip()
-                if not ch:
-                    continue
-                vals = r.get("values") or {}
-                self.conn.execute(
-                    """
-                    INSERT INTO access_example_rows(set_id, channel, values_json, sort_order)
-                    VALUES(?,?,?,?)
-                    """,
-                    (int(set_id), ch, json.dumps(vals, ensure_ascii=False), i),
-                )
+            # FK kontrolleri commit'te toplu yapılsın (transaction sonunda otomatik sıfırlanır)
+            self.conn.execute("PRAGMA defer_foreign_keys=ON")
+            sid = int(set_id)
+            batch = [
+                (sid, ch, _dump_json(r.get("values") or {}), i)
+                for i, r in enumerate(rows)
+                if (ch := (r.get("channel") or "").strip())
+            ]
+            self.conn.executemany(
+                """
+                INSERT INTO access_example_rows(set_id, channel, values_json, sort_order)
+                VALUES(?,?,?,?)
+                """,
+                batch,
+            )
 
             self.conn.commit()
         except Exception:
@@ -565,25 +582,46 @@ class Repository:
 
     def get_access_channel_hour_map(self, set_id: int, channel_name: str) -> dict[str, float]:
         """Verilen kanal için normalize(hour)->value döndürür."""
-        _meta, rows = self.load_access_set(int(set_id))
         ch_norm = (channel_name or "").strip().upper()
-        for r in rows:
-            ch = (str(r.get("channel") or "")).strip().upper()
-            if ch == ch_norm:
-                vals = r.get("values") or {}
-                out: dict[str, float] = {}
-                for k, v in vals.items():
-                    kk = self._norm_hour_label(str(k))
-                    try:
-                        out[kk] = float(str(v).replace(",", "."))
-                    except Exception:
-                        # boş/bozuk hücre
-                        continue
-                return out
-        return {}
-
-
+        # Sadece istenen kanalın satırını çek (idx_access_rows_set_channel)
+        row = self.conn.execute(
+            """
+            SELECT values_json
+            FROM access_example_rows
+            WHERE set_id=? AND UPPER(channel)=?
+            ORDER BY sort_order, id
+            LIMIT 1
+            """,
+            (int(set_id), ch_norm),
+        ).fetchone()
+        if row is None:
+            # SQLite UPPER() sadece ASCII çevirir ('Açık' -> 'AçıK'); Türkçe karakterli
+            # kanal adları için Python tarafında karşılaştır.
+            for r in self.conn.execute(
+                "SELECT channel, values_json FROM access_example_rows WHERE set_id=? ORDER BY sort_order, id",
+                (int(set_id),),
+            ):
+                if str(r["channel"] or "").strip().upper() == ch_norm:
+                    row = r
+                    break
+            else:
+                return {}
+        try:
+            vals = json.loads(row["values_json"] or "{}")
+        except Exception:
+            vals = {}
+        if not isinstance(vals, dict):
+            return {}
 
+        norm = self._norm_hour_label
+        out: dict[str, float] = {}
+        for k, v in vals.items():
+            try:
+                out[norm(str(k))] = float(str(v).replace(",", "."))
+            except Exception:
+                # boş/bozuk hücre
+                continue
+        return out
 
     def get_latest_access_set_id(self) -> int | None:
         row = self.conn.execute(
@@ -696,6 +734,31 @@ class Repository:
             out[(int(r["channel_id"]), int(r["month"]))] = (float(r["price_dt"]), float(r["price_odt"]))
         return out
 
+    def get_channel_prices_by_channel(
+        self, year: int, advertiser_name: str | None = None
+    ) -> dict[int, tuple[list[float], list[float]]]:
+        """Fiyat tablosu için kanal bazlı düzen: channel_id -> (12 aylık DT, 12 aylık ODT).
+
+        Birleştirme kuralı get_channel_prices ile aynı (global '' önce, reklam verene özel sonra ezer);
+        tek sorgu, satır başına tek dict erişimi.
+        """
+        nm = self._resolve_advertiser_name(advertiser_name or "")
+        out: dict[int, tuple[list[float], list[float]]] = {}
+        rows = self.conn.execute(
+            "SELECT channel_id, month, price_dt, price_odt FROM channel_prices "
+            "WHERE year=? AND advertiser_name IN ('', ?) "
+            "ORDER BY advertiser_name != ''",
+            (int(year), nm),
+        ).fetchall()
+        for cid, month, dt, odt in rows:
+            m = int(month) - 1
+            if not 0 <= m < 12:
+                continue
+            dts, odts = out.setdefault(int(cid), ([0.0] * 12, [0.0] * 12))
+            dts[m] = float(dt)
+            odts[m] = float(odt)
+        return out
+
     def upsert_channel_price(
         self,
         year: int,
@@ -716,6 +779,35 @@ class Repository:
         )
         self.conn.commit()
 
+    def upsert_channel_prices_many(
+        self,
+        year: int,
+        prices: list[tuple[int, int, float, float]],
+        advertiser_name: str | None = None,
+    ) -> None:
+        """Toplu upsert: (month, channel_id, price_dt, price_odt) listesi, tek transaction."""
+        if not prices:
+            return
+        nm = self._resolve_advertiser_name(advertiser_name or "")
+        y = int(year)
+
+        # Eğer zaten açık transaction varsa tekrar BEGIN deme (SQLite patlıyor)
+        if not self.conn.in_transaction:
+            self.conn.execute("BEGIN")
+        try:
+            self.conn.executemany(
+                "INSERT INTO channel_prices(advertiser_name, year, month, channel_id, price_dt, price_odt) "
+                "VALUES(?,?,?,?,?,?) "
+                "ON CONFLICT(advertiser_name, year, month, channel_id) DO UPDATE SET "
+                "price_dt=excluded.price_dt, "
+                "price_odt=excluded.price_odt",
+                [(nm, y, int(m), int(cid), float(dt), float(odt)) for m, cid, dt, odt in prices],
+            )
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
 
     # ------------------------------
     # SPOTLİST+ (yayınlandı durumu)
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QSignalBlocker, QTimer, Signal
 from PySide6.QtGui import QKeyEvent, QKeySequence
 from PySide6.QtWidgets import QApplication, QTableWidget, QTableWidgetItem
 
+# resolved once; avoids walking the Qt enum proxy on every paste/clear
+_EDITABLE = Qt.ItemIsEditable
+# pastes with more rows than this show a wait cursor while writing
+_BUSY_PASTE_ROWS = 200
+
 
 class ExcelTableWidget(QTableWidget):
     """QTableWidget with Excel-like clipboard behavior.
@@ -18,6 +23,8 @@ class ExcelTableWidget(QTableWidget):
     - Copy uses TSV (tab-separated values) so pasting to/from Excel works.
     - Paste starts from the current cell. If a range is selected, its top-left is used.
     - Non-editable cells are skipped on paste/clear (e.g., locked columns).
+    - Paste/clear write with repaints and signals suspended; afterwards
+      ``itemChanged`` is emitted once per touched column (not per cell).
     """
 
     def keyPressEvent(self, event: QKeyEvent) -> None:
@@ -30,8 +37,9 @@ class ExcelTableWidget(QTableWidget):
             event.accept()
             return
         if event.matches(QKeySequence.Paste):
-            self.paste_from_clipboard()
+            # let the key event return first; clipboard read + write run on the next loop turn
             event.accept()
+            QTimer.singleShot(0, self.paste_from_clipboard)
             return
 
         if event.key() in (Qt.Key_Delete, Qt.Key_Backspace):
@@ -54,19 +62,44 @@ class ExcelTableWidget(QTableWidget):
             return None
         return cr, cc, cr, cc
 
+    def _begin_bulk_update(self) -> tuple[QSignalBlocker, QSignalBlocker]:
+        """Suspend repaint and widget/model signals for a bulk write."""
+        self.setUpdatesEnabled(False)
+        return QSignalBlocker(self), QSignalBlocker(self.model())
+
+    def _end_bulk_update(
+        self,
+        blockers: tuple[QSignalBlocker, QSignalBlocker],
+        changed: dict[int, QTableWidgetItem],
+        rows: tuple[int, int],
+    ) -> None:
+        for b in blockers:
+            b.unblock()
+        self.setUpdatesEnabled(True)
+        if changed:
+            # one dataChanged for the written block instead of one per cell
+            model = self.model()
+            model.dataChanged.emit(
+                model.index(rows[0], min(changed)),
+                model.index(rows[1], max(changed)),
+            )
+        self.viewport().update()
+        # let listeners (e.g. PlanningGrid recalc) still see the edit
+        for it in changed.values():
+            self.itemChanged.emit(it)
+
     def copy_selection(self) -> None:
         rect = self._selection_rect()
         if not rect:
             return
         top, left, bottom, right = rect
 
-        lines: list[str] = []
-        for r in range(top, bottom + 1):
-            row_vals: list[str] = []
-            for c in range(left, right + 1):
-                it = self.item(r, c)
-                row_vals.append(it.text() if it else "")
-            lines.append("\t".join(row_vals))
+        item = self.item
+        cols = range(left, right + 1)
+        lines = [
+            "\t".join((it.text() if (it := item(r, c)) else "") for c in cols)
+            for r in range(top, bottom + 1)
+        ]
 
         QApplication.clipboard().setText("\n".join(lines))
 
@@ -80,54 +113,97 @@ class ExcelTableWidget(QTableWidget):
             return
         top, left, bottom, right = rect
 
-        for r in range(top, bottom + 1):
-            for c in range(left, right + 1):
-                it = self.item(r, c)
-                if not it:
-                    continue
-                if not (it.flags() & Qt.ItemIsEditable):
-                    continue
-                it.setText("")
+        get_item = self.item
+        editable = _EDITABLE
+        changed: dict[int, QTableWidgetItem] = {}
+        blockers = self._begin_bulk_update()
+        try:
+            for r in range(top, bottom + 1):
+                for c in range(left, right + 1):
+                    it = get_item(r, c)
+                    if not it:
+                        continue
+                    if not (it.flags() & editable):
+                        continue
+                    it.setText("")
+                    changed.setdefault(c, it)
+        finally:
+            self._end_bulk_update(blockers, changed, (top, bottom))
 
     def paste_from_clipboard(self) -> None:
         text = QApplication.clipboard().text()
         if not text:
             return
 
-        # normalize line endings and strip trailing empty lines
-        rows = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
-        while rows and rows[-1] == "":
+        # splitlines() handles \r\n / \r / \n in one pass; strip trailing empty lines
+        rows = text.splitlines()
+        while rows and not rows[-1]:
             rows.pop()
         if not rows:
             return
 
-        grid = [r.split("\t") for r in rows]
-
+        # _selection_rect already falls back to the current cell
         rect = self._selection_rect()
-        if rect:
-            start_row, start_col = rect[0], rect[1]
-        else:
-            start_row, start_col = self.currentRow(), self.currentColumn()
-
-        if start_row < 0 or start_col < 0:
+        if rect is None:
             return
+        start_row, start_col = rect[0], rect[1]
 
         max_r = self.rowCount()
         max_c = self.columnCount()
+        fit_cols = max_c - start_col
+        if fit_cols <= 0:
+            return
 
-        for r_off, row_vals in enumerate(grid):
-            r = start_row + r_off
-            if r >= max_r:
-                break
-            for c_off, val in enumerate(row_vals):
-                c = start_col + c_off
-                if c >= max_c:
+        # stop splitting past the last column; the unsplit remainder lands on
+        # column max_c and is dropped by the bounds check below
+        grid = [r.split("\t", fit_cols) for r in rows[: max(0, max_r - start_row)]]
+
+        get_item = self.item
+        set_item = self.setItem
+        editable = _EDITABLE
+        changed: dict[int, QTableWidgetItem] = {}
+        busy = len(grid) > _BUSY_PASTE_ROWS
+        if busy:
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+        blockers = self._begin_bulk_update()
+        try:
+            for r_off, row_vals in enumerate(grid):
+                r = start_row + r_off
+                if r >= max_r:
                     break
+                for c_off, val in enumerate(row_vals):
+                    c = start_col + c_off
+                    if c >= max_c:
+                        break
+
+                    it = get_item(r, c)
+                    if it is None:
+                        it = QTableWidgetItem("")
+                        set_item(r, c, it)
+                    if not (it.flags() & editable):
+                        continue
+                    it.setText(val)
+                    changed.setdefault(c, it)
+        finally:
+            last_row = min(start_row + len(grid), max_r) - 1
+            self._end_bulk_update(blockers, changed, (start_row, last_row))
+            if busy:
+                QApplication.restoreOverrideCursor()
+
+
+class PasteRequestTableWidget(QTableWidget):
+    """QTableWidget that hands Ctrl+V / Shift+Insert to its owner.
+
+    Emits ``pasteRequested`` instead of pasting itself, for tables whose paste
+    needs custom parsing (e.g. the access example table). Handled in
+    keyPressEvent, so no event filter runs for every event on the widget.
+    """
 
-                it = self.item(r, c)
-                if it is None:
-                    it = QTableWidgetItem("")
-                    self.setItem(r, c, it)
-                if not (it.flags() & Qt.ItemIsEditable):
-                    continue
-                it.setText(val)
+    pasteRequested = Signal()
+
+    def keyPressEvent(self, event: QKeyEvent) -> None:
+        if event.matches(QKeySequence.Paste):
+            event.accept()
+            self.pasteRequested.emit()
+            return
+        super().keyPressEvent(event)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+class ExportWorkerSignals(QObject):
+    """Worker thread -> GUI thread bildirimleri (queued connection)."""
+
+    finished = Signal(str, str)  # (mesaj, çıktı yolu)
+    failed = Signal(str)
+
+
+class ExportWorker(QRunnable):
+    """Excel export'u QThreadPool üzerinde çalıştırır (UI donmasın).
+
+    Not: Sadece dosya üretimi (openpyxl) burada koşmalı. sqlite bağlantısı
+    thread'e bağlı olduğu için DB işleri çağıran tarafta (GUI thread) yapılır.
+    """
+
+    def __init__(self, fn: Callable[..., Any], *args: Any, ok_text: str = "", **kwargs: Any) -> None:
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.ok_text = ok_text
+        self.signals = ExportWorkerSignals()
+
+    def run(self) -> None:
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(self.ok_text, str(result or ""))
@@ -1,23 +1,27 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from pathlib import Path
 from datetime import time, datetime, date
 
-from PySide6.QtCore import Qt, QDate, QEvent, QTimer
-from PySide6.QtGui import QColor, QBrush, QFont, QKeySequence
+from PySide6.QtCore import Qt, QDate, QSignalBlocker, QTimer, QThreadPool
+from PySide6.QtGui import QColor, QBrush, QFont
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QPushButton, QTabWidget, QFileDialog, QMessageBox, QListWidget,
-    QDateEdit, QGroupBox, QSpinBox, QTableWidget, QTableWidgetItem, QAbstractItemView, QAbstractItemDelegate,
+    QDateEdit, QGroupBox, QSpinBox, QTableWidget, QTableWidgetItem, QTableView, QAbstractItemView, QAbstractItemDelegate,
     QHeaderView, QComboBox, QApplication, QInputDialog, QPlainTextEdit,
      QSizePolicy,  QFrame
 )
 
 from src.settings.app_settings import SettingsService, AppSettings
-from src.storage.db import ensure_data_folders, connect_db, migrate_and_seed
+from src.storage.db import connect_db
 from src.storage.repository import Repository
 from src.ui.planning_grid import PlanningGrid
-from src.ui.excel_table import ExcelTableWidget
+from src.ui.excel_table import ExcelTableWidget, PasteRequestTableWidget
+from src.ui.export_worker import ExportWorker
+from src.ui.reservation_table_model import ReservationTableModel
+from src.ui.storage_worker import AccessSaveWorker, QueryWorker, StorageBootstrapWorker
 
 
 from src.domain.models import ReservationDraft, ConfirmedReservation
@@ -54,6 +58,30 @@ MONTHS_TR = [
     "ARALIK",
 ]
 
+# Tablo doldururken sık kullanılan hizalamalar (her hücrede enum OR'u yapılmasın)
+_ALIGN_CENTER = Qt.AlignCenter
+_ALIGN_LEFT_V = Qt.AlignLeft | Qt.AlignVCenter
+# Fiyat hücresinde sayı dışı karakterler (₺, boşluk, TL ...) için son çare temizliği
+_NUM_CLEAN = re.compile(r"[^\d.\-]")
+# Erişim örneği: "Aralık 2025" -> 2025; "07:00-08:00 (x)" -> "07:00-08:00"
+_YEAR_RE = re.compile(r"(19\d{2}|20\d{2})")
+_HOUR_SUFFIX_RE = re.compile(r"\([^\)]*\)\s*$")
+# Fiyat tablosu başlıkları sabit: KANAL + her ay için DT/ODT
+_PRICE_HEADERS = ("KANAL", *(f"{mn}\n{band}" for mn in MONTHS_TR for band in ("DT", "ODT")))
+_NO_PRICES = ((0.0,) * 12, (0.0,) * 12)
+# Ondalık virgülü noktaya çevirir; tek translate, zincir replace yerine
+_COMMA_TO_DOT = str.maketrans(",", ".")
+
+
+def _looks_numeric(t: str) -> bool:
+    """'52,47' / '52.47' / '1200' / '%12,5' gibi hücreler için True."""
+    try:
+        float(t.strip("% ").translate(_COMMA_TO_DOT))
+        return True
+    except ValueError:
+        return False
+
+
 class MainWindow(QMainWindow):
     def __init__(self) -> None:
         super().__init__()
@@ -63,16 +91,50 @@ class MainWindow(QMainWindow):
 
         self.settings_service = SettingsService()
         self.app_settings: AppSettings = self.settings_service.build()
+        # Şablon yolu ayarlara bağlı; ayar değişene kadar tekrar çözülmez
+        self._template_path: Path | None = None
 
         self.repo: Repository | None = None
         self.service: ReservationService | None = None
         self.current_confirmed: ConfirmedReservation | None = None
         self._home_price_cache: dict[tuple[str, int], dict[tuple[int, int], tuple[float, float]]] = {}
+        # Kanal combobox'ları sadece kanal/fiyat verisi değişince DB'den yeniden kurulur
+        self._channels_dirty = True
+        self._res_channels_dirty = True
+        # Ana sayfa reklam vereni (strip edilmiş); grid fiyat çözümü her hücrede combobox'a gitmesin
+        self._current_advertiser = ""
         # UI performansı: Ana sayfa hesap güncellemelerini debounce et
         self._home_ctx_timer = QTimer(self)
         self._home_ctx_timer.setSingleShot(True)
         self._home_ctx_timer.setInterval(80)
         self._home_ctx_timer.timeout.connect(self._refresh_home_grid_calculation_context_now)
+        # Rezervasyon araması: her tuşta sorgu atma, yazma durunca tek sorgu
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._on_search_changed_now)
+        # Son aramaların sonuçları (LRU); DB değişince (total_changes) sıfırlanır
+        self._search_cache: OrderedDict[str, list[str]] = OrderedDict()
+        self._search_cache_changes: tuple[int, int] | None = None
+        # Listede gösterilen son arama (baştaki/sondaki boşluk eklenince tekrar doldurma)
+        self._last_search_q: str | None = None
+        # Arka plan sorguları (QueryWorker): istek no -> sinyal nesnesi; güncel aramanın/listenin no'su
+        self._query_seq = 0
+        self._query_signals: dict[int, object] = {}
+        self._search_token = 0
+        self._search_token_q = ""
+        self._res_query_token = 0
+        # Tarih kutusunda ay/yıl hızlı döndürülürken ara tarihler için grid kurulmasın
+        self._pending_plan_date: QDate | None = None
+        self._date_timer = QTimer(self)
+        self._date_timer.setSingleShot(True)
+        self._date_timer.setInterval(80)
+        self._date_timer.timeout.connect(self._apply_pending_plan_date)
+        # Rezervasyon listesi: aynı olay turunda gelen yıl/ay/kanal/arama değişimleri tek sorguda
+        self._res_refresh_timer = QTimer(self)
+        self._res_refresh_timer.setSingleShot(True)
+        self._res_refresh_timer.setInterval(0)
+        self._res_refresh_timer.timeout.connect(self._do_refresh_reservations)
         
         root = QWidget()
         self.setCentralWidget(root)
@@ -114,6 +176,25 @@ class MainWindow(QMainWindow):
         self._home_range_start: date | None = None
         self._home_range_end: date | None = None
 
+        # DB hazırlığı sürerken (bootstrap worker) kayıt butonları kapalı tutulur
+        self._storage_busy = False
+        # Erişim örneği DB kaydı sürüyorsa worker sinyal nesnesi (yoksa None)
+        self._access_save_signals = None
+        self._access_set_id: int | None = None
+        self._po_syncing: bool = False
+        # Diğer sekmeler ilk açıldıklarında kurulur (açılış hızlansın). bootstrap_storage /
+        # on_tab_changed bunları okuduğu için ikisinden de önce tanımlı olmalı.
+        self._tab_builders = {
+            "SPOTLİST+": self._build_spotlist_tab,
+            "PLAN ÖZET": self._build_plan_ozet_tab,
+            "KOD TANIMI": self._build_kod_tanimi_tab,
+            "Fiyat ve Kanal Tanımı": self._build_price_channel_tab,
+            "Erişim Örneği": self._build_access_example_tab,
+        }
+        self._tab_built: set[str] = set()
+        # KOD TANIMI son doldurulan içerik (aynıysa tablo yeniden yazılmaz)
+        self._kod_last_sig: tuple | None = None
+
         # ANA SAYFA (rezervasyon girişi)
         self._build_home_tab()
 
@@ -142,14 +223,6 @@ class MainWindow(QMainWindow):
 
         self.tabs.currentChanged.connect(self.on_tab_changed)
         self.on_tab_changed(self.tabs.currentIndex())
-        self._access_set_id: int | None = None
-        self._po_syncing: bool = False
-        self._build_spotlist_tab()
-        self._build_plan_ozet_tab()
-        self._build_kod_tanimi_tab()
-        self._build_price_channel_tab()
-        self._build_access_example_tab()
-        
 
 
     def _build_home_tab(self) -> None:
@@ -374,7 +447,7 @@ class MainWindow(QMainWindow):
         self.plan_grid.set_price_resolver(self._resolve_home_grid_unit_price)
 
         # Tarih değişince grid ay/gün vurgusunu güncelle
-        self.in_date.dateChanged.connect(self.on_plan_date_changed)
+        self.in_date.dateChanged.connect(self._on_in_date_changed)
         self.in_channel.currentTextChanged.connect(self.on_channel_changed)
 
         # Kod ve kanal aksiyonları
@@ -392,8 +465,6 @@ class MainWindow(QMainWindow):
         self.in_code_definition.textChanged.connect(lambda *_: self._refresh_home_grid_calculation_context())
         self.in_spot_duration.valueChanged.connect(lambda *_: self._refresh_home_grid_calculation_context())
         self.in_agency_commission.valueChanged.connect(lambda *_: self._refresh_home_grid_calculation_context())
-        self.in_advertiser.currentTextChanged.connect(lambda *_: self._refresh_home_grid_calculation_context())
-        self.in_channel.currentTextChanged.connect(lambda *_: self._refresh_home_grid_calculation_context())
 
         # tarih aralığı defaultu: mevcut ay
         today = self.in_date.date()
@@ -443,10 +514,21 @@ class MainWindow(QMainWindow):
         height += tbl.frameWidth() * 2 + 6  # küçük pay
         tbl.setFixedHeight(max(height, 38))  # boşken de çok küçülmesin
         
+    def _mark_channels_dirty(self) -> None:
+        """Kanal listesi / fiyatlar değişti: sonraki refresh çağrıları DB'den yeniden kursun."""
+        self._channels_dirty = True
+        self._res_channels_dirty = True
+
     def refresh_channel_combo(self) -> None:
-        """Rezervasyon sekmesindeki kanal listesini DB'den yeniler."""
+        """Rezervasyon sekmesindeki kanal listesini DB'den yeniler.
+
+        Kanal verisi değişmediyse (_channels_dirty False) hiçbir şey yapmaz; kayıt
+        seçimlerinde her tıklamada sorgu + combobox kurulumu olmasın.
+        """
         if not getattr(self, "repo", None) or not hasattr(self, "in_channel"):
             return
+        if not self._channels_dirty:
+            return
         self.in_channel.blockSignals(True)
         try:
             current = self.in_channel.currentText().strip()
@@ -463,12 +545,10 @@ class MainWindow(QMainWindow):
                     self.in_channel.setCurrentIndex(idx)
         finally:
             self.in_channel.blockSignals(False)
+        self._channels_dirty = False
 
-        self._home_price_cache.clear()
         self._home_price_cache.clear()
         self._apply_channel_access_ratio_to_grid()
-        self._refresh_home_grid_calculation_context()
-        self._refresh_home_grid_calculation_context()
 
     def _get_home_access_year(self) -> int:
         try:
@@ -489,7 +569,6 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
             self._refresh_home_grid_calculation_context()
-            self._refresh_home_grid_calculation_context()
             return
 
         try:
@@ -516,10 +595,7 @@ class MainWindow(QMainWindow):
     def _resolve_home_grid_unit_price(self, d: date, row_kind: str) -> float:
         if not getattr(self, "repo", None):
             return 0.0
-        try:
-            adv = (self.in_advertiser.currentText() or "").strip()
-        except Exception:
-            adv = ""
+        adv = self._current_advertiser
         if not adv:
             return 0.0
 
@@ -546,7 +622,7 @@ class MainWindow(QMainWindow):
 
         yy = int(getattr(d, "year", datetime.now().year))
         mm = int(getattr(d, "month", 1))
-        key = (adv.strip().lower(), yy)
+        key = (adv.lower(), yy)
         if key not in self._home_price_cache:
             try:
                 self._home_price_cache[key] = self.repo.get_channel_prices(yy, adv) or {}
@@ -610,7 +686,6 @@ class MainWindow(QMainWindow):
 
     def on_channel_changed(self, text: str) -> None:
         self._apply_channel_access_ratio_to_grid(text)
-        self._refresh_home_grid_calculation_context()
 
     def refresh_advertiser_combo(self) -> None:
         """Ana sayfadaki Reklam veren combobox listesini DB'den yeniler."""
@@ -645,16 +720,56 @@ class MainWindow(QMainWindow):
                     self.in_advertiser.setCurrentText(pick)
         finally:
             self.in_advertiser.blockSignals(False)
+        # sinyaller kapalıyken metin değişmiş olabilir
+        self._current_advertiser = (self.in_advertiser.currentText() or "").strip()
         self._home_price_cache.clear()
         self._refresh_home_grid_calculation_context()
 
-    def bootstrap_storage(self) -> None:
-        ensure_data_folders(self.app_settings.data_dir)
-        db_path = self.app_settings.data_dir / "data.db"
-        conn = connect_db(db_path)
-        migrate_and_seed(conn)
+    def bootstrap_storage(self, on_ready=None) -> None:
+        """DB hazırlığını (klasör + migrate/seed) QThreadPool'da başlatır.
+
+        Bitince _on_storage_ready GUI thread'de repo/service'i kurar ve listeleri tazeler;
+        on_ready verilmişse en sonda çağrılır.
+        """
+        self._storage_token = int(getattr(self, "_storage_token", 0)) + 1
+        self._storage_on_ready = on_ready
+        worker = StorageBootstrapWorker(self._storage_token, self.app_settings.data_dir)
+        # Sinyal nesnesi iş bitene kadar yaşamalı
+        self._storage_signals = worker.signals
+        worker.signals.ready.connect(self._on_storage_ready)
+        worker.signals.failed.connect(self._on_storage_failed)
+
+        self._set_storage_busy(True)
+        QThreadPool.globalInstance().start(worker)
+
+    def _set_storage_busy(self, busy: bool) -> None:
+        self._storage_busy = busy
+        for name in ("btn_save", "btn_pick_folder", "btn_new_reservation"):
+            btn = getattr(self, name, None)
+            if btn is not None:
+                btn.setEnabled(not busy)
+        self._update_access_save_enabled()
+
+    def _update_access_save_enabled(self) -> None:
+        """Erişim örneği Kaydet: DB hazır değilken veya önceki kayıt sürerken kapalı."""
+        btn = getattr(self, "btn_access_save", None)
+        if btn is not None:
+            btn.setEnabled(not self._storage_busy and self._access_save_signals is None)
+
+    def _on_storage_ready(self, token: int, db_path: str) -> None:
+        # Arada yeni klasör seçildiyse eski sonucu yok say
+        if token != getattr(self, "_storage_token", 0):
+            return
+        self._set_storage_busy(False)
+
+        self._db_path = Path(db_path)
+        conn = connect_db(self._db_path)
         self.repo = Repository(conn)
         self.service = ReservationService(self.repo)
+        self._mark_channels_dirty()
+        # önceki DB'ye atılmış arka plan sorgularının sonuçları uygulanmasın
+        self._search_token = 0
+        self._res_query_token = 0
 
         # UI bağımlı listeleri yenile
         self.refresh_channel_combo()
@@ -669,6 +784,31 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+        # Erişim sekmesi repo hazır olmadan kurulduysa (ya da klasör değiştiyse) DB'den yükle;
+        # aksi halde _access_set_id boş kalır ve kayıt yılın mevcut setinin üstüne yazar
+        if self._is_tab_built("Erişim Örneği"):
+            try:
+                self.access_load_latest_db()
+            except Exception as e:
+                QMessageBox.warning(self, "Uyarı", f"Erişim örneği yüklenemedi:\n{e}")
+
+        # Açık sekme repo olmadan kurulduysa şimdi doldur
+        try:
+            self.on_tab_changed(self.tabs.currentIndex())
+        except Exception:
+            pass
+
+        cb, self._storage_on_ready = getattr(self, "_storage_on_ready", None), None
+        if cb is not None:
+            cb()
+
+    def _on_storage_failed(self, token: int, message: str) -> None:
+        if token != getattr(self, "_storage_token", 0):
+            return
+        self._set_storage_busy(False)
+        self._storage_on_ready = None
+        QMessageBox.critical(self, "Hata", f"Veri klasörü/DB hazırlanamadı:\n{message}")
+
     def pick_data_folder(self) -> None:
         p = QFileDialog.getExistingDirectory(self, "Veri klasörünü seç")
         if not p:
@@ -676,21 +816,39 @@ class MainWindow(QMainWindow):
         data_dir = Path(p)
         self.settings_service.set_data_dir(data_dir)
         self.app_settings = self.settings_service.build()
+        self._template_path = None
         self.data_dir_label.setText(f"Veri Klasörü: {self.app_settings.data_dir}")
 
+        def _done() -> None:
+            self.refresh_price_channel_tab()
+            QMessageBox.information(self, "OK", "Veri klasörü kaydedildi ve DB hazırlandı.")
+
         # Re-bootstrap
-        self.bootstrap_storage()
-        self.refresh_price_channel_tab()
-        QMessageBox.information(self, "OK", "Veri klasörü kaydedildi ve DB hazırlandı.")
+        self.bootstrap_storage(on_ready=_done)
 
     def on_search_changed(self, text: str) -> None:
+        """Arama kutusu değişimini debounce eder (her tuşta DB sorgusu atmasın)."""
+        try:
+            self._search_timer.start()
+        except Exception:
+            self._on_search_changed_now()
+
+    def _on_search_changed_now(self) -> None:
         # Rezervasyonlar sekmesindeki plan başlığı araması
         if not hasattr(self, "list_advertisers"):
             return
-        self.list_advertisers.clear()
-
+        text = self.search_edit.text() if hasattr(self, "search_edit") else ""
         q = (text or "").strip()
+        # Sadece boşluk / ASCII harf büyüklüğü değişti: sonuç aynı, liste zaten güncel
+        q_key = q.translate(self._ASCII_UPPER)
+        if q_key == self._last_search_q:
+            return
+        self._last_search_q = q_key
+        # yolda olan DB araması varsa sonucu artık geçersiz
+        self._search_token = 0
+
         if not q:
+            self.list_advertisers.clear()
             try:
                 self.list_advertisers.setVisible(False)
             except Exception:
@@ -703,17 +861,115 @@ class MainWindow(QMainWindow):
             return
 
         if not self.repo:
+            self._last_search_q = None
             return
 
-        names = list(self.repo.search_plan_titles(q, limit=30) or [])
-        for name in names:
-            self.list_advertisers.addItem(name)
+        names = self._search_cache_lookup(q)
+        if names is not None:
+            self._show_search_results(names)
+            return
+
+        # DB sorgusu QThreadPool'da; sonuç _on_search_results ile GUI thread'e döner
+        limit = self._SEARCH_LIMIT
+        self._search_token_q = q
+        self._search_token = self._start_query(
+            lambda repo: list(repo.search_plan_titles(q, limit=limit) or []),
+            self._on_search_results,
+        )
+
+    def _on_search_results(self, token: int, names: list) -> None:
+        self._query_signals.pop(token, None)
+        if token != self._search_token:
+            return  # arada metin değişti / arama kapatıldı
+        self._search_token = 0
+        self._search_cache_store(self._search_token_q, names)
+        self._show_search_results(names)
+
+    def _show_search_results(self, names: list[str]) -> None:
+        # Tek seferde doldur: satır başı repaint/sinyal olmasın
+        self.list_advertisers.setUpdatesEnabled(False)
+        prev_block = self.list_advertisers.blockSignals(True)
+        try:
+            self.list_advertisers.clear()
+            self.list_advertisers.addItems(names)
+        finally:
+            self.list_advertisers.blockSignals(prev_block)
+            self.list_advertisers.setUpdatesEnabled(True)
 
         try:
             self.list_advertisers.setVisible(len(names) > 0)
         except Exception:
             pass
 
+    def _start_query(self, fn, on_ready) -> int:
+        """Salt-okunur repo sorgusunu QueryWorker ile başlatır; istek no döner."""
+        self._query_seq += 1
+        token = self._query_seq
+        worker = QueryWorker(token, self._db_path, fn)
+        # Sinyal nesnesi iş bitene kadar yaşamalı
+        self._query_signals[token] = worker.signals
+        worker.signals.ready.connect(on_ready)
+        worker.signals.failed.connect(self._on_query_failed)
+        QThreadPool.globalInstance().start(worker)
+        return token
+
+    def _on_query_failed(self, token: int, message: str) -> None:
+        self._query_signals.pop(token, None)
+        if token == self._search_token:
+            # aynı metinle tekrar denenebilsin
+            self._search_token = 0
+            self._last_search_q = None
+            QMessageBox.warning(self, "Uyarı", f"Plan başlığı araması başarısız:\n{message}")
+        elif token == self._res_query_token:
+            self._res_query_token = 0
+            QMessageBox.warning(self, "Uyarı", f"Rezervasyon listesi okunamadı:\n{message}")
+
+    _SEARCH_LIMIT = 30
+    _SEARCH_CACHE_SIZE = 32
+    # SQLite UPPER()/LIKE sadece ASCII harfleri katlar; bellekte süzerken aynısını yap
+    _ASCII_UPPER = str.maketrans("abcdefghijklmnopqrstuvwxyz", "ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
+    def _search_cache_lookup(self, q: str) -> list[str] | None:
+        """search_plan_titles önbelleği; DB'ye gitmek gerekiyorsa None.
+
+        - Aynı metin tekrar aranırsa (geri silme vb.) DB'ye gitmez.
+        - Önceki bir arama q'nun parçasıysa ve sonucu limit'e takılmadıysa,
+          o listeyi bellekte süzer (LIKE '%q%' sonucu onun alt kümesidir).
+        """
+        try:
+            # bağlantı değişirse (veri klasörü) ya da bu bağlantıdan yazım olursa geçersiz
+            changes = (id(self.repo.conn), int(self.repo.conn.total_changes))
+        except Exception:
+            changes = None
+        cache = self._search_cache
+        if changes is None or changes != self._search_cache_changes:
+            cache.clear()
+            self._search_cache_changes = changes
+
+        hit = cache.get(q)
+        if hit is not None:
+            cache.move_to_end(q)
+            return list(hit)
+
+        names: list[str] | None = None
+        # LIKE joker karakterleri varsa bellekte süzme yapma
+        if "%" not in q and "_" not in q:
+            qu = q.translate(self._ASCII_UPPER)
+            for k, prev in reversed(cache.items()):
+                if len(prev) < self._SEARCH_LIMIT and k in q and "%" not in k and "_" not in k:
+                    names = [n for n in prev if qu in n.translate(self._ASCII_UPPER)]
+                    break
+        if names is None:
+            return None
+        self._search_cache_store(q, names)
+        return list(names)
+
+    def _search_cache_store(self, q: str, names: list[str]) -> None:
+        cache = self._search_cache
+        cache[q] = names
+        if len(cache) > self._SEARCH_CACHE_SIZE:
+            cache.popitem(last=False)
+
     def on_advertiser_selected(self, item) -> None:
         if not item:
             return
@@ -734,9 +990,12 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-        # arama sonuç listesini kapat (ekranı boğmasın)
+        # arama sonuç listesini kapat (ekranı boğmasın); bekleyen debounce'u iptal et
         try:
+            self._search_timer.stop()
+            self._search_token = 0
             self.list_advertisers.setVisible(False)
+            self._last_search_q = None
         except Exception:
             pass
 
@@ -780,26 +1039,17 @@ class MainWindow(QMainWindow):
                 ds = datetime.fromisoformat(str(p.get("span_start"))).date()
                 de = datetime.fromisoformat(str(p.get("span_end"))).date()
 
-                self.in_range_start.blockSignals(True)
-                self.in_range_end.blockSignals(True)
-                self.in_range_start.setDate(QDate(ds.year, ds.month, ds.day))
-                self.in_range_end.setDate(QDate(de.year, de.month, de.day))
-                self.in_range_start.blockSignals(False)
-                self.in_range_end.blockSignals(False)
-
-                self.in_date.blockSignals(True)
-                self.in_date.setDate(QDate(ds.year, ds.month, ds.day))
-                self.in_date.blockSignals(False)
+                self._set_date_silent(self.in_range_start, QDate(ds.year, ds.month, ds.day))
+                self._set_date_silent(self.in_range_end, QDate(de.year, de.month, de.day))
+                self._set_date_silent(self.in_date, QDate(ds.year, ds.month, ds.day))
 
                 self.on_apply_date_range()
             else:
                 dstr = p.get("plan_date")
                 if dstr:
                     d = datetime.fromisoformat(str(dstr)).date()
-                    self.in_date.blockSignals(True)
-                    self.in_date.setDate(QDate(d.year, d.month, d.day))
-                    self.in_date.blockSignals(False)
-                    self.on_plan_date_changed(self.in_date.date())
+                    self._set_date_silent(self.in_date, QDate(d.year, d.month, d.day))
+                    self.on_plan_date_changed(self.in_date.date(), rebuild=True)
         except Exception:
             pass
 
@@ -850,6 +1100,8 @@ class MainWindow(QMainWindow):
             if hasattr(self, "list_advertisers"):
                 self.list_advertisers.clear()
                 self.list_advertisers.setVisible(False)
+            self._search_token = 0
+            self._last_search_q = None
         except Exception:
             pass
 
@@ -858,7 +1110,40 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-    def on_plan_date_changed(self, qd: QDate) -> None:
+    @staticmethod
+    def _set_date_silent(edit: QDateEdit, qd: QDate) -> None:
+        """Programatik tarih ataması; dateChanged tetiklenmez (grid iki kez kurulmasın)."""
+        blocker = QSignalBlocker(edit)
+        try:
+            edit.setDate(qd)
+        finally:
+            blocker.unblock()
+
+    def _on_in_date_changed(self, qd: QDate) -> None:
+        """dateChanged debounce: sadece son tarih uygulanır."""
+        self._pending_plan_date = qd
+        try:
+            self._date_timer.start()
+        except Exception:
+            self._apply_pending_plan_date()
+
+    def _apply_pending_plan_date(self) -> None:
+        qd = self._pending_plan_date
+        if qd is None:
+            return
+        self.on_plan_date_changed(qd)
+
+    def _flush_pending_plan_date(self) -> None:
+        """Bekleyen tarih değişimini hemen uygula (grid okunmadan önce)."""
+        if self._pending_plan_date is not None:
+            self._date_timer.stop()
+            self._apply_pending_plan_date()
+
+    def on_plan_date_changed(self, qd: QDate, rebuild: bool = False) -> None:
+        """Tarih değişimi. rebuild=True: aynı ay olsa da grid'i yeniden kur (kayıt yükleme)."""
+        # Doğrudan çağrı bekleyen debounce'u geçersiz kılar
+        self._pending_plan_date = None
+        self._date_timer.stop()
         d = qd.toPython()
 
         # Eğer grid tarih aralığı (span) modundaysa, ay değiştirmeden sadece seçili günü vurgula.
@@ -867,13 +1152,25 @@ class MainWindow(QMainWindow):
                 self.plan_grid.set_selected_date(d)
                 self._home_price_cache.clear()
                 self._apply_channel_access_ratio_to_grid()
-                self._refresh_home_grid_calculation_context()
                 return
         except Exception:
             pass
 
         new_key = (d.year, d.month)
 
+        # Aynı ay içinde sadece gün değiştiyse grid'i yeniden kurma; başlık vurgusunu taşı
+        # (set_month tabloyu temizleyip bu ayın girilmiş hücrelerini de silerdi).
+        try:
+            if (
+                not rebuild
+                and new_key == self._current_month_key
+                and (self.plan_grid.year, self.plan_grid.month) == new_key
+            ):
+                self.plan_grid.highlight_day(d.day)
+                return
+        except Exception:
+            pass
+
         # Aynı ay içinde gün değişiyorsa cache'e dokunma
         if self._current_month_key is None:
             self._current_month_key = new_key
@@ -905,15 +1202,17 @@ class MainWindow(QMainWindow):
         Reklam veren ancak gerçek bir işlemde (rezervasyon kaydı / fiyat sayfasında ekle-kaydet)
         tabloya yazılmalıdır.
         """
+        nm = (text or "").strip()
+        self._current_advertiser = nm
+        self._home_price_cache.clear()
+        # Hesap güncellemesi buradan (ayrıca lambda bağlantısı yok)
+        self._refresh_home_grid_calculation_context()
         if not getattr(self, "repo", None):
             return
-        nm = (text or "").strip()
         try:
             self.repo.set_meta("main_advertiser", nm)
         except Exception:
             pass
-        self._home_price_cache.clear()
-        self._refresh_home_grid_calculation_context()
 
     # -------------------------
     # Çoklu Kod Tanımları (ANA SAYFA)
@@ -1088,8 +1387,9 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
 
-        # tek sefer hesapla
+        # Sinyaller bloklu yazıldı: matris önbelleğini düşür, tek sefer hesapla
         try:
+            self.plan_grid._invalidate_matrix_cache()
             self.plan_grid._schedule_recalc()
         except Exception:
             pass
@@ -1211,7 +1511,8 @@ class MainWindow(QMainWindow):
             sel = self.in_date.date().toPython()
             if sel < rs or sel > re:
                 sel = rs
-                self.in_date.setDate(QDate(sel.year, sel.month, sel.day))
+                # Sinyalsiz: set_date_span aşağıda grid'i zaten kuruyor (çift set_month olmasın)
+                self._set_date_silent(self.in_date, QDate(sel.year, sel.month, sel.day))
 
             # Eski aylık cache'leri temizle; artık edit tek grid üzerinde.
             self._month_cells_cache = {}
@@ -1220,14 +1521,12 @@ class MainWindow(QMainWindow):
             self.plan_grid.set_date_span(rs, re, selected_date=sel)
             self._home_price_cache.clear()
             self._apply_channel_access_ratio_to_grid()
-            self._refresh_home_grid_calculation_context()
         except Exception:
             # Fallback: en azından eski davranış bozulmasın
             try:
                 self.plan_grid.set_month(rs.year, rs.month, rs.day)
                 self._home_price_cache.clear()
                 self._apply_channel_access_ratio_to_grid()
-                self._refresh_home_grid_calculation_context()
             except Exception:
                 pass
 
@@ -1244,6 +1543,7 @@ class MainWindow(QMainWindow):
         if not self.service:
             QMessageBox.warning(self, "Hata", "Servis hazır değil (DB bağlantısı yok).")
             return
+        self._flush_pending_plan_date()
 
         if not getattr(self, "repo", None):
             QMessageBox.warning(self, "Hata", "Repo hazır değil (DB bağlantısı yok).")
@@ -1549,6 +1849,7 @@ class MainWindow(QMainWindow):
         if not self.service:
             QMessageBox.warning(self, "Hata", "Servis hazır değil (DB bağlantısı yok).")
             return
+        self._flush_pending_plan_date()
 
         try:
             # Spot saati kullanıcı girmiyor; Excel zaten çıktıda zaman damgasını basıyor.
@@ -1671,7 +1972,13 @@ class MainWindow(QMainWindow):
 
         Not: Uygulama farklı CWD ile açılabildiği ve PyInstaller'da dosyalar _MEIPASS altına
         çıktığı için resource_path fallback'i yapıyoruz.
+        Sonuç ayarlar yeniden okunana kadar (pick_data_folder) önbellekte tutulur.
         """
+        if self._template_path is None:
+            self._template_path = self._resolve_template_path_uncached()
+        return self._template_path
+
+    def _resolve_template_path_uncached(self) -> Path:
         from src.util.paths import resource_path
 
         tp = getattr(self.app_settings, "template_path", None)
@@ -1698,11 +2005,12 @@ class MainWindow(QMainWindow):
         try:
             template_path = self._resolve_template_path()
             out_dir = self.app_settings.data_dir / "exports"
-            out_path = self.service.export_test(template_path, out_dir, self.current_confirmed)
-
-            QMessageBox.information(self, "OK", f"Test çıktısı üretildi:\n{out_path}")
+            out_path, payload = self.service.prepare_test_export(out_dir, self.current_confirmed)
         except Exception as e:
             QMessageBox.critical(self, "Hata", str(e))
+            return
+
+        self._start_export_job(template_path, out_path, payload, "Test çıktısı üretildi:")
 
 
     def on_save_export(self) -> None:
@@ -1713,11 +2021,50 @@ class MainWindow(QMainWindow):
         try:
             template_path = self._resolve_template_path()
             out_dir = self.app_settings.data_dir / "exports"
-            out_path = self.service.save_and_export(template_path, out_dir, self.current_confirmed)
-
-            QMessageBox.information(self, "OK", f"Kaydedildi ve çıktı alındı:\n{out_path}")
+            # DB kaydı GUI thread'de (sqlite bağlantısı thread'e bağlı)
+            out_path, payload = self.service.prepare_saved_export(out_dir, self.current_confirmed)
         except Exception as e:
             QMessageBox.critical(self, "Hata", str(e))
+            return
+
+        self._start_export_job(template_path, out_path, payload, "Kaydedildi ve çıktı alındı:")
+
+    def _set_export_buttons_enabled(self, enabled: bool) -> None:
+        for name in ("btn_test_export", "btn_save_export"):
+            btn = getattr(self, name, None)
+            if btn is not None:
+                btn.setEnabled(enabled)
+
+    def _start_export_job(self, template_path: Path, out_path: Path, payload: dict, ok_text: str) -> None:
+        """Excel yazımını QThreadPool'da çalıştır; sonuç GUI thread'e sinyalle döner."""
+        from src.export.excel_exporter import export_excel
+
+        worker = ExportWorker(export_excel, template_path, out_path, payload, ok_text=ok_text)
+        # Sinyal nesnesi iş bitene kadar yaşamalı
+        self._export_jobs = getattr(self, "_export_jobs", [])
+        self._export_jobs.append(worker.signals)
+        worker.signals.finished.connect(self._on_export_job_finished)
+        worker.signals.failed.connect(self._on_export_job_failed)
+
+        self._set_export_buttons_enabled(False)
+        QThreadPool.globalInstance().start(worker)
+
+    def _end_export_job(self, sig) -> None:
+        try:
+            if sig in self._export_jobs:
+                self._export_jobs.remove(sig)
+        except Exception:
+            pass
+        if not getattr(self, "_export_jobs", None):
+            self._set_export_buttons_enabled(True)
+
+    def _on_export_job_finished(self, ok_text: str, out_path: str) -> None:
+        self._end_export_job(self.sender())
+        QMessageBox.information(self, "OK", f"{ok_text}\n{out_path}")
+
+    def _on_export_job_failed(self, message: str) -> None:
+        self._end_export_job(self.sender())
+        QMessageBox.critical(self, "Hata", message)
 
     def reset_form_for_new_reservation(self) -> None:
         self._loaded_reservation_id = None
@@ -1759,13 +2106,32 @@ class MainWindow(QMainWindow):
 
         try:
             self.kod_table.setRowCount(0)
+            self._kod_last_sig = None
         except Exception:
             pass
 
         self._apply_channel_access_ratio_to_grid()
 
+    def _is_tab_built(self, tab_name: str) -> bool:
+        """Lazy kurulan sekme henüz kurulmadıysa False (ana sekmeler hep True)."""
+        return tab_name not in self._tab_builders or tab_name in self._tab_built
+
+    def _ensure_tab(self, tab_name: str) -> None:
+        """Sekme içeriğini ilk gösterimde bir kez kur."""
+        if self._is_tab_built(tab_name):
+            return
+        # Önce işaretle: builder içinden tekrar tetiklenirse ikinci kez kurulmasın
+        self._tab_built.add(tab_name)
+        try:
+            self._tab_builders[tab_name]()
+        except Exception as e:
+            # Yarım kurulan sekme "kurulu" kalmasın; refresh_* guard'ları eksik widget'a gitmesin
+            self._tab_built.discard(tab_name)
+            QMessageBox.critical(self, "Hata", f"{tab_name} sekmesi açılamadı:\n{e}")
+
     def on_tab_changed(self, idx: int) -> None:
         tab_name = self.tabs.tabText(idx)
+        self._ensure_tab(tab_name)
 
         if tab_name == "REZERVASYONLAR":
             # Home'daki plan başlığı varsa, rezervasyonlar sekmesi aramasına yansıt.
@@ -1830,6 +2196,11 @@ class MainWindow(QMainWindow):
         self.list_advertisers = QListWidget()
         self.list_advertisers.setObjectName("resSearchResults")
         self.list_advertisers.setMaximumHeight(110)
+        # Tek satırlık düz metin: Qt her satır için sizeHint hesaplamasın
+        self.list_advertisers.setUniformItemSizes(True)
+        # Sonuç limiti ileride kalkarsa yerleşim tek seferde değil parça parça yapılsın
+        self.list_advertisers.setLayoutMode(QListWidget.LayoutMode.Batched)
+        self.list_advertisers.setBatchSize(self._SEARCH_LIMIT)
         self.list_advertisers.setVisible(False)
         sb.addWidget(self.list_advertisers)
 
@@ -1877,27 +2248,18 @@ class MainWindow(QMainWindow):
         top.addStretch(1)
 
         # Liste
-        self.res_table = QTableWidget()
-        self.res_table.setColumnCount(8)
-        self.res_table.setHorizontalHeaderLabels(
-            [
-                "Rezervasyon No",
-                "Plan Başlığı",
-                "Plan Tarihi",
-                "Kanal",
-                "Spot Kodu",
-                "Süre (sn)",
-                "Adet",
-                "Kayıt Zamanı",
-            ]
-        )
+        # Model/view: hücreler sadece görünen satırlar için üretilir
+        self.res_table = QTableView()
+        self._res_model = ReservationTableModel(self.res_table)
+        self.res_table.setModel(self._res_model)
         self.res_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.res_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.res_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.res_table.verticalHeader().setVisible(False)
         self.res_table.setAlternatingRowColors(True)
         self.res_table.horizontalHeader().setStretchLastSection(True)
-        self.res_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        # ResizeToContents her değişimde sütunları yeniden ölçer; genişlik refresh sonunda bir kez ayarlanır
+        self.res_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
         layout.addWidget(self.res_table, 2)
 
         # Preview
@@ -1920,7 +2282,7 @@ class MainWindow(QMainWindow):
         self.btn_res_export_selected.clicked.connect(self.on_reservation_export_selected)
         self.btn_res_export_filtered.clicked.connect(self.on_reservation_export_filtered)
         self.btn_res_open_exports.clicked.connect(self.open_exports_folder)
-        self.res_table.itemSelectionChanged.connect(self.on_reservation_selected)
+        self.res_table.selectionModel().selectionChanged.connect(lambda *_: self.on_reservation_selected())
 
         # Arama (sekme içi)
         self.search_edit.textChanged.connect(self.on_search_changed)
@@ -1943,6 +2305,8 @@ class MainWindow(QMainWindow):
     def refresh_reservation_channel_filter(self) -> None:
         if not getattr(self, "repo", None) or not hasattr(self, "res_channel"):
             return
+        if not self._res_channels_dirty:
+            return
         current = self.res_channel.currentText().strip() if self.res_channel.count() else ""
         self.res_channel.blockSignals(True)
         try:
@@ -1956,9 +2320,14 @@ class MainWindow(QMainWindow):
                     self.res_channel.setCurrentIndex(idx)
         finally:
             self.res_channel.blockSignals(False)
+        self._res_channels_dirty = False
 
-    def refresh_reservations_tab(self) -> None:
-        if not getattr(self, "repo", None):
+    def refresh_reservations_tab(self, *_args) -> None:
+        """Rezervasyon listesini bir sonraki olay turunda yeniler (art arda çağrılar birleşir)."""
+        self._res_refresh_timer.start()
+
+    def _do_refresh_reservations(self) -> None:
+        if not getattr(self, "repo", None) or not hasattr(self, "_res_model"):
             return
 
         # Rezervasyon listesi için plan başlığı: önce REZERVASYONLAR araması, yoksa ana sayfadaki başlık.
@@ -1970,8 +2339,10 @@ class MainWindow(QMainWindow):
             pt = ""
         if not pt:
             pt = (self.in_plan_title.text() or "").strip()
+        # yolda olan eski sorgunun sonucu artık geçersiz
+        self._res_query_token = 0
         self._res_records = []
-        self.res_table.setRowCount(0)
+        self._res_model.set_records(self._res_records)
         self.res_preview_title.setText("")
         try:
             self.res_preview_grid.clear_matrix()
@@ -1985,50 +2356,21 @@ class MainWindow(QMainWindow):
         month = int(self.res_month.currentData() or 0)
         ch_filter = str(self.res_channel.currentData() or "").strip()
 
-        recs = self.repo.list_confirmed_reservations_by_plan_title(pt, limit=50000)
-        # filtrele
-        filtered = []
-        for r in recs:
-            p = r.payload or {}
-            try:
-                y, m, d = str(p.get("plan_date") or "").split("-")
-                yy = int(y)
-                mm = int(m)
-            except Exception:
-                continue
-
-            if yy != year:
-                continue
-            if month and mm != month:
-                continue
-            if ch_filter:
-                if str(p.get("channel_name") or "").strip() != ch_filter:
-                    continue
-            filtered.append(r)
-
-        # yeni -> eski
-        filtered.sort(key=lambda x: x.created_at, reverse=True)
+        # yıl/ay/kanal filtresi SQL'de (QueryWorker); sonuç yeni -> eski sıralı gelir
+        self._res_query_token = self._start_query(
+            lambda repo: repo.list_confirmed_reservations_filtered(pt, year, month, ch_filter),
+            self._on_reservations_loaded,
+        )
 
+    def _on_reservations_loaded(self, token: int, filtered: list) -> None:
+        self._query_signals.pop(token, None)
+        if token != self._res_query_token:
+            return  # filtre arada değişti; yeni sorgu yolda
+        self._res_query_token = 0
         self._res_records = filtered
-        self.res_table.setRowCount(len(filtered))
-
-        for i, r in enumerate(filtered):
-            p = r.payload or {}
-            res_no = str(r.reservation_no or "")
-            plan_title = str(p.get("plan_title") or "")
-            if bool(p.get("is_span")) and p.get("span_start") and p.get("span_end"):
-                plan_date = f"{p.get('span_start')} - {p.get('span_end')}"
-            else:
-                plan_date = str(p.get("plan_date") or "")
-            channel = str(p.get("channel_name") or "")
-            spot_code = str(p.get("spot_code") or "")
-            duration = str(p.get("spot_duration_sec") or "")
-            adet = str(p.get("adet_total") or "")
-            created = str(r.created_at or "")
-
-            for col, val in enumerate([res_no, plan_title, plan_date, channel, spot_code, duration, adet, created]):
-                it = QTableWidgetItem(str(val))
-                self.res_table.setItem(i, col, it)
+        # Tek model reset; genişlik bir kez ayarlanır
+        self._res_model.set_records(filtered)
+        self.res_table.resizeColumnsToContents()
 
     def _get_selected_reservation_records(self) -> list:
         rows = {idx.row() for idx in self.res_table.selectionModel().selectedRows()}
@@ -2124,16 +2466,9 @@ class MainWindow(QMainWindow):
                 ds = datetime.fromisoformat(str(p.get("span_start"))).date()
                 de = datetime.fromisoformat(str(p.get("span_end"))).date()
 
-                self.in_range_start.blockSignals(True)
-                self.in_range_end.blockSignals(True)
-                self.in_range_start.setDate(QDate(ds.year, ds.month, ds.day))
-                self.in_range_end.setDate(QDate(de.year, de.month, de.day))
-                self.in_range_start.blockSignals(False)
-                self.in_range_end.blockSignals(False)
-
-                self.in_date.blockSignals(True)
-                self.in_date.setDate(QDate(ds.year, ds.month, ds.day))
-                self.in_date.blockSignals(False)
+                self._set_date_silent(self.in_range_start, QDate(ds.year, ds.month, ds.day))
+                self._set_date_silent(self.in_range_end, QDate(de.year, de.month, de.day))
+                self._set_date_silent(self.in_date, QDate(ds.year, ds.month, ds.day))
 
                 try:
                     self.on_apply_date_range()
@@ -2143,10 +2478,8 @@ class MainWindow(QMainWindow):
                 dstr = p.get("plan_date")
                 if dstr:
                     d = datetime.fromisoformat(str(dstr)).date()
-                    self.in_date.blockSignals(True)
-                    self.in_date.setDate(QDate(d.year, d.month, d.day))
-                    self.in_date.blockSignals(False)
-                    self.on_plan_date_changed(self.in_date.date())
+                    self._set_date_silent(self.in_date, QDate(d.year, d.month, d.day))
+                    self.on_plan_date_changed(self.in_date.date(), rebuild=True)
         except Exception:
             pass
 
@@ -2312,7 +2645,7 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
         
-        self.on_search_changed(self.search_edit.text())
+        self._on_search_changed_now()
         QMessageBox.information(self, "OK", "Seçili rezervasyon(lar) silindi.")
 
     # ------------------------------
@@ -2416,7 +2749,7 @@ class MainWindow(QMainWindow):
                         yy = int(yy)
                         mm = int(mm)
                     else:
-                        yy = int(payload2.get("year") or self.price_year.value())
+                        yy = int(payload2.get("year") or (self.price_year.value() if hasattr(self, "price_year") else datetime.now().year))
                         mm = int(payload2.get("month") or 1)
 
                     ch_id = None
@@ -2640,6 +2973,8 @@ class MainWindow(QMainWindow):
         self.btn_spot_clear_filters.clicked.connect(self._spotlist_clear_filters)
 
     def refresh_spotlist(self) -> None:
+        if not self._is_tab_built("SPOTLİST+"):
+            return  # sekme henüz kurulmadı; ilk açılışta tazelenir
         if not self.service:
             return
 
@@ -2667,12 +3002,8 @@ class MainWindow(QMainWindow):
                 dmin = date.today()
                 dmax = date.today()
 
-            self.spot_from.blockSignals(True)
-            self.spot_to.blockSignals(True)
-            self.spot_from.setDate(QDate(dmin.year, dmin.month, dmin.day))
-            self.spot_to.setDate(QDate(dmax.year, dmax.month, dmax.day))
-            self.spot_from.blockSignals(False)
-            self.spot_to.blockSignals(False)
+            self._set_date_silent(self.spot_from, QDate(dmin.year, dmin.month, dmin.day))
+            self._set_date_silent(self.spot_to, QDate(dmax.year, dmax.month, dmax.day))
 
             self.spot_pub_filter.setCurrentIndex(0)
             self.spot_filters_initialized = True
@@ -2689,17 +3020,13 @@ class MainWindow(QMainWindow):
             dmin = date.today()
             dmax = date.today()
 
-        self.spot_from.blockSignals(True)
-        self.spot_to.blockSignals(True)
-        self.spot_pub_filter.blockSignals(True)
-
-        self.spot_from.setDate(QDate(dmin.year, dmin.month, dmin.day))
-        self.spot_to.setDate(QDate(dmax.year, dmax.month, dmax.day))
-        self.spot_pub_filter.setCurrentIndex(0)
-
-        self.spot_from.blockSignals(False)
-        self.spot_to.blockSignals(False)
-        self.spot_pub_filter.blockSignals(False)
+        self._set_date_silent(self.spot_from, QDate(dmin.year, dmin.month, dmin.day))
+        self._set_date_silent(self.spot_to, QDate(dmax.year, dmax.month, dmax.day))
+        blocker = QSignalBlocker(self.spot_pub_filter)
+        try:
+            self.spot_pub_filter.setCurrentIndex(0)
+        finally:
+            blocker.unblock()
 
         self._apply_spotlist_filters()
 
@@ -2995,6 +3322,8 @@ class MainWindow(QMainWindow):
         Not: Geçmişte bazı yerlerde bu metoda yanlışlıkla parametre gönderilmişti.
         Güvenli olması için *args/**kwargs kabul ediyor.
         """
+        if not self._is_tab_built("PLAN ÖZET"):
+            return  # sekme henüz kurulmadı; ilk açılışta tazelenir
         # Öncelik: Rezervasyon tabındaki tarih aralığı (widget'lar mevcutsa)
         rs = None
         re_ = None
@@ -3077,6 +3406,8 @@ class MainWindow(QMainWindow):
 
     def refresh_plan_ozet(self) -> None:
         """Plan Özet tablosunu tarih aralığına göre (tek tip) yeniler."""
+        if not self._is_tab_built("PLAN ÖZET"):
+            return  # sekme henüz kurulmadı; ilk açılışta tazelenir
         if not hasattr(self, "po_table"):
             return
 
@@ -3142,7 +3473,6 @@ class MainWindow(QMainWindow):
         day_headers = [f"{TR_DOW_UI[d.weekday()]}\n{d:%d.%m}" for d in dates]
 
         # Ay başlıkları
-        MONTHS_TR = ["OCAK","ŞUBAT","MART","NİSAN","MAYIS","HAZİRAN","TEMMUZ","AĞUSTOS","EYLÜL","EKİM","KASIM","ARALIK"]
         month_headers = []
         for (yy, mm) in months:
             mn = MONTHS_TR[int(mm) - 1]
@@ -3308,6 +3638,16 @@ class MainWindow(QMainWindow):
 
         layout.addWidget(self.kod_table, 1)
 
+        # refresh_kod_tanimi her seferinde yeniden oluşturmasın
+        self._kod_font_plain = QFont()
+        self._kod_font_italic = QFont()
+        self._kod_font_italic.setItalic(True)
+        self._kod_font_bold_italic = QFont()
+        self._kod_font_bold_italic.setBold(True)
+        self._kod_font_bold_italic.setItalic(True)
+        self._kod_brush_none = QBrush()
+        self._kod_brush_total = QBrush(QColor("#8BC34A"))
+
         self.btn_kod_refresh.clicked.connect(self.refresh_kod_tanimi)
         self.btn_kod_delete.clicked.connect(self.delete_selected_kod)
         self.btn_kod_export.clicked.connect(self.export_kod_tanimi_excel)
@@ -3321,65 +3661,84 @@ class MainWindow(QMainWindow):
 
 
     def refresh_kod_tanimi(self) -> None:
+        if not self._is_tab_built("KOD TANIMI"):
+            return  # sekme henüz kurulmadı; ilk açılışta tazelenir
         if not self.service:
             return
         pt = self.in_plan_title.text().strip()
         if not pt:
             return
 
+        # Ortalama uzunluk / dağılım toplamı tablo doldurulurken hesaplanır
+        # (get_kod_tanimi_avg_len satırları DB'den tekrar kurardı).
         rows = self.service.get_kod_tanimi_rows(pt)
-        avg_len = self.service.get_kod_tanimi_avg_len(pt)
+
+        # Sekmeye her dönüşte aynı içerik tekrar yazılmasın
+        sig = (pt, tuple((r["code"], r["code_desc"], r["length_sn"], r["distribution"]) for r in rows))
+        if sig == self._kod_last_sig:
+            return
+        self._kod_last_sig = sig
+
+        tbl = self.kod_table
+        center = _ALIGN_CENTER
+        left = _ALIGN_LEFT_V
+        f_plain = self._kod_font_plain
+        f_italic = self._kod_font_italic
+        f_bi = self._kod_font_bold_italic
+        no_brush = self._kod_brush_none
+
+        get_item = tbl.item
+        set_item = tbl.setItem
+        new_item = QTableWidgetItem
+
+        def _put(r: int, c: int, text: str, align, font: QFont = f_plain, brush: QBrush = no_brush) -> None:
+            # Var olan hücreyi yeniden kullan; önceki yenilemeden kalan stil de sıfırlansın
+            it = get_item(r, c)
+            if it is None:
+                it = new_item(text)
+                set_item(r, c, it)
+            else:
+                it.setText(text)
+            it.setTextAlignment(align)
+            it.setFont(font)
+            it.setBackground(brush)
 
         data_count = max(len(rows), 7)
-        self.kod_table.setRowCount(data_count + 1)
-
-        # Veri satırları
-        for i, r in enumerate(rows):
-            it0 = QTableWidgetItem(r["code"])
-            it0.setTextAlignment(Qt.AlignCenter)
-            self.kod_table.setItem(i, 0, it0)
-
-            it1 = QTableWidgetItem(r["code_desc"])
-            f_italic = QFont()
-            f_italic.setItalic(True)
-            it1.setFont(f_italic)
-            self.kod_table.setItem(i, 1, it1)
-
-            it2 = QTableWidgetItem(str(int(r["length_sn"])))
-            it2.setTextAlignment(Qt.AlignCenter)
-            self.kod_table.setItem(i, 2, it2)
-
-            it3 = QTableWidgetItem(f"{r['distribution']:.0%}")
-            it3.setTextAlignment(Qt.AlignCenter)
-            self.kod_table.setItem(i, 3, it3)
-
-        # Şablon gibi 7 satıra kadar boş satır göster
-        for rr in range(len(rows), data_count):
-            for cc in range(4):
-                it = QTableWidgetItem("")
-                it.setTextAlignment(Qt.AlignCenter if cc != 1 else Qt.AlignLeft | Qt.AlignVCenter)
-                self.kod_table.setItem(rr, cc, it)
-
-        # Toplam / Ortalama satırı
-        last = data_count
-        f_bi = QFont()
-        f_bi.setBold(True)
-        f_bi.setItalic(True)
-
-        it0 = QTableWidgetItem("Ort.Uzun.")
-        it0.setFont(f_bi)
-        self.kod_table.setItem(last, 0, it0)
-
-        it2 = QTableWidgetItem(f"{avg_len:.2f}")
-        it2.setTextAlignment(Qt.AlignCenter)
-        it2.setFont(f_bi)
-        self.kod_table.setItem(last, 2, it2)
-
-        it3 = QTableWidgetItem(f"{sum(r['distribution'] for r in rows):.0%}")
-        it3.setTextAlignment(Qt.AlignCenter)
-        it3.setFont(f_bi)
-        it3.setBackground(QBrush(QColor("#8BC34A")))
-        self.kod_table.setItem(last, 3, it3)
+        tbl.setUpdatesEnabled(False)
+        tbl.setSortingEnabled(False)
+        prev_block = tbl.blockSignals(True)
+        try:
+            tbl.setRowCount(data_count + 1)
+
+            # Veri satırları
+            avg_len = 0.0
+            total_dist = 0.0
+            for i, r in enumerate(rows):
+                dist = r["distribution"]
+                avg_len += r["length_sn"] * dist
+                total_dist += dist
+                _put(i, 0, r["code"], center)
+                _put(i, 1, r["code_desc"], left, f_italic)
+                _put(i, 2, str(int(r["length_sn"])), center)
+                _put(i, 3, f"{dist:.0%}", center)
+
+            # Şablon gibi 7 satıra kadar boş satır göster. Tablo düzenlenemez; boş hücre için
+            # item gerekmez, sadece önceki yenilemeden kalan item varsa metni silinir.
+            for rr in range(len(rows), data_count):
+                for cc in range(4):
+                    it = get_item(rr, cc)
+                    if it is not None:
+                        it.setText("")
+
+            # Toplam / Ortalama satırı
+            last = data_count
+            _put(last, 0, "Ort.Uzun.", left, f_bi)
+            _put(last, 1, "", left)
+            _put(last, 2, f"{avg_len:.2f}", center, f_bi)
+            _put(last, 3, f"{total_dist:.0%}", center, f_bi, self._kod_brush_total)
+        finally:
+            tbl.blockSignals(prev_block)
+            tbl.setUpdatesEnabled(True)
 
     def delete_selected_kod(self) -> None:
         if not self.service:
@@ -3396,6 +3755,7 @@ class MainWindow(QMainWindow):
             return
 
         deleted = self.service.delete_kod_for_plan_title(pt, code)
+        self._kod_last_sig = None
         QMessageBox.information(self, "OK", f"{code} koduna ait {deleted} kayıt silindi.")
         self.refresh_kod_tanimi()
 
@@ -3479,10 +3839,9 @@ class MainWindow(QMainWindow):
         self.btn_adv_delete.clicked.connect(self.delete_price_advertiser)
         self.btn_adv_rename.clicked.connect(self.rename_price_advertiser)
 
-    def _month_names_tr(self) -> list[str]:
-        return ["OCAK", "ŞUBAT", "MART", "NİSAN", "MAYIS", "HAZİRAN", "TEMMUZ", "AĞUSTOS", "EYLÜL", "EKİM", "KASIM", "ARALIK"]
-
     def refresh_price_channel_tab(self) -> None:
+        if not self._is_tab_built("Fiyat ve Kanal Tanımı"):
+            return  # sekme henüz kurulmadı; ilk açılışta tazelenir
         if not self.repo:
             return
 
@@ -3490,36 +3849,36 @@ class MainWindow(QMainWindow):
         try:
             current_adv = (self.price_advertiser.currentText() or "").strip()
             advs = self.repo.list_advertisers()
-            self.price_advertiser.blockSignals(True)
-            self.price_advertiser.clear()
-            self.price_advertiser.addItem("")
-            for a in advs:
-                self.price_advertiser.addItem(a)
-
-            meta_adv = (self.repo.get_meta("price_advertiser") or "").strip()
-            pick = current_adv or meta_adv
-            if pick:
-                # yoksa yazsın (editable)
-                idx = self.price_advertiser.findText(pick)
-                if idx >= 0:
-                    self.price_advertiser.setCurrentIndex(idx)
-                else:
-                    self.price_advertiser.setCurrentText(pick)
-            self.price_advertiser.blockSignals(False)
-        except Exception:
+            blocker = QSignalBlocker(self.price_advertiser)
             try:
-                self.price_advertiser.blockSignals(False)
-            except Exception:
-                pass
+                self.price_advertiser.clear()
+                self.price_advertiser.addItem("")
+                self.price_advertiser.addItems(advs)
+
+                meta_adv = (self.repo.get_meta("price_advertiser") or "").strip()
+                pick = current_adv or meta_adv
+                if pick:
+                    # yoksa yazsın (editable)
+                    idx = self.price_advertiser.findText(pick)
+                    if idx >= 0:
+                        self.price_advertiser.setCurrentIndex(idx)
+                    else:
+                        self.price_advertiser.setCurrentText(pick)
+            finally:
+                blocker.unblock()
+        except Exception:
+            pass
 
         # Meta'dan son seçilen yılı çek
         meta_year = self.repo.get_meta("price_year")
         if meta_year and meta_year.isdigit():
             my = int(meta_year)
             if self.price_year.value() != my:
-                self.price_year.blockSignals(True)
-                self.price_year.setValue(my)
-                self.price_year.blockSignals(False)
+                blocker = QSignalBlocker(self.price_year)
+                try:
+                    self.price_year.setValue(my)
+                finally:
+                    blocker.unblock()
 
         year = int(self.price_year.value())
         try:
@@ -3533,72 +3892,97 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-        months = self._month_names_tr()
-
-        headers = ["KANAL"]
-        for mn in months:
-            headers.append(f"{mn}\nDT")
-            headers.append(f"{mn}\nODT")
+        headers = _PRICE_HEADERS
 
-        self.price_table.clear()
-        self.price_table.setColumnCount(len(headers))
-        self.price_table.setHorizontalHeaderLabels(headers)
+        tbl = self.price_table
+        # Başlık/kolon düzeni sabit: yalnızca ilk seferde (veya kolon sayısı değişirse) kur
+        if tbl.columnCount() != len(headers):
+            tbl.clear()
+            tbl.setColumnCount(len(headers))
+            tbl.setHorizontalHeaderLabels(list(headers))
 
-        # Kanal adı genişleyebilir; fiyat kolonlarını dar tutuyoruz ki mümkün olduğunca yatay scroll istemesin.
-        self.price_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-        for c in range(1, len(headers)):
-            self.price_table.horizontalHeader().setSectionResizeMode(c, QHeaderView.Fixed)
-            self.price_table.setColumnWidth(c, 55)
+            # Kanal adı genişleyebilir; fiyat kolonlarını dar tutuyoruz ki mümkün olduğunca yatay scroll istemesin.
+            hdr = tbl.horizontalHeader()
+            hdr.setSectionResizeMode(0, QHeaderView.Stretch)
+            for c in range(1, len(headers)):
+                hdr.setSectionResizeMode(c, QHeaderView.Fixed)
+                hdr.resizeSection(c, 55)
 
         channels = self.repo.list_channels(active_only=True)
-        prices = self.repo.get_channel_prices(year, adv_name)
+        prices = self.repo.get_channel_prices_by_channel(year, adv_name)
 
-        self.price_table.setRowCount(len(channels))
+        fill_row = self._fill_price_row
 
-        for r, ch in enumerate(channels):
-            cid = int(ch["id"])
-            name = str(ch["name"])
+        # Doldururken sıralama kapalı olmalı; yoksa her setItem satırları yeniden dizer
+        tbl.setUpdatesEnabled(False)
+        tbl.setSortingEnabled(False)
+        prev_block = tbl.blockSignals(True)
+        try:
+            tbl.setRowCount(len(channels))
 
-            it_name = QTableWidgetItem(name)
-            it_name.setData(Qt.UserRole, cid)
-            self.price_table.setItem(r, 0, it_name)
+            for r, ch in enumerate(channels):
+                cid = int(ch["id"])
+                fill_row(r, cid, str(ch["name"]), prices.get(cid, _NO_PRICES))
+        finally:
+            tbl.blockSignals(prev_block)
+            tbl.setSortingEnabled(True)
+            tbl.setUpdatesEnabled(True)
 
-            col = 1
-            for m in range(1, 13):
-                dt, odt = prices.get((cid, m), (0.0, 0.0))
+        try:
+            tbl.sortItems(0, Qt.AscendingOrder)
+        except Exception:
+            pass
 
-                it_dt = QTableWidgetItem("" if dt == 0 else f"{dt:g}")
-                try:
-                    it_dt.setData(Qt.EditRole, float(dt))
-                except Exception:
-                    pass
-                it_dt.setTextAlignment(Qt.AlignCenter)
-                self.price_table.setItem(r, col, it_dt)
-                col += 1
+    def _fill_price_row(self, r: int, cid: int, name: str, month_prices) -> None:
+        """Fiyat tablosunda tek kanal satırını yazar; var olan hücreler yeniden kullanılır.
+
+        month_prices: (12 aylık DT, 12 aylık ODT). Çağıran sıralamayı kapatmış olmalı.
+        """
+        tbl = self.price_table
+        get_item = tbl.item
+        set_item = tbl.setItem
 
-                it_odt = QTableWidgetItem("" if odt == 0 else f"{odt:g}")
+        it_name = get_item(r, 0)
+        if it_name is None:
+            it_name = QTableWidgetItem(name)
+            set_item(r, 0, it_name)
+        else:
+            it_name.setText(name)
+        it_name.setData(Qt.UserRole, cid)
+
+        col = 1
+        for pair in zip(*month_prices):
+            for v in pair:
+                it = get_item(r, col)
+                if it is None:
+                    it = QTableWidgetItem()
+                    it.setTextAlignment(_ALIGN_CENTER)
+                    set_item(r, col, it)
+                it.setText("" if v == 0 else f"{v:g}")
                 try:
-                    it_odt.setData(Qt.EditRole, float(odt))
+                    it.setData(Qt.EditRole, float(v))
                 except Exception:
                     pass
-                it_odt.setTextAlignment(Qt.AlignCenter)
-                self.price_table.setItem(r, col, it_odt)
                 col += 1
 
-        try:
-            self.price_table.sortItems(0, Qt.AscendingOrder)
-        except Exception:
-            pass
-
     def _parse_float_cell(self, item: QTableWidgetItem | None) -> float:
         if not item:
             return 0.0
-        t = (item.text() or "").strip()
+        t = item.text()
         if not t:
             return 0.0
-        t = t.replace(",", ".")
+        # Hızlı yol: düz sayı (float() baştaki/sondaki boşluğu kendisi atar)
         try:
             return float(t)
+        except ValueError:
+            pass
+        t = t.strip().translate(_COMMA_TO_DOT)
+        try:
+            return float(t)
+        except ValueError:
+            pass
+        try:
+            return float(_NUM_CLEAN.sub("", t))
         except ValueError:
             return 0.0
 
@@ -3624,32 +4008,45 @@ class MainWindow(QMainWindow):
         year = int(self.price_year.value())
 
         try:
-            for r in range(self.price_table.rowCount()):
-                it_name = self.price_table.item(r, 0)
-                name = (it_name.text() if it_name else "").strip()
-                if not name:
-                    continue
-
-                cid = it_name.data(Qt.UserRole) if it_name else None
-                if cid:
-                    self.repo.update_channel_name(int(cid), name)
-                    channel_id = int(cid)
-                else:
-                    channel_id = self.repo.get_or_create_channel(name)
-                    it_name.setData(Qt.UserRole, channel_id)
-
-                col = 1
-                for m in range(1, 13):
-                    price_dt = self._parse_float_cell(self.price_table.item(r, col))
-                    price_odt = self._parse_float_cell(self.price_table.item(r, col + 1))
-                    self.repo.upsert_channel_price(year, m, channel_id, price_dt, price_odt, adv_name)
-                    col += 2
+            parse = self._parse_float_cell
+            get_item = self.price_table.item
+            prices: list[tuple[int, int, float, float]] = []
+            # Okuma sırasında satırlar yer değiştirmesin (sort) ve itemChanged tetiklenmesin
+            tbl = self.price_table
+            tbl.setSortingEnabled(False)
+            prev_block = tbl.blockSignals(True)
+            try:
+                for r in range(tbl.rowCount()):
+                    it_name = tbl.item(r, 0)
+                    name = (it_name.text() if it_name else "").strip()
+                    if not name:
+                        continue
 
+                    cid = it_name.data(Qt.UserRole) if it_name else None
+                    if cid:
+                        self.repo.update_channel_name(int(cid), name)
+                        channel_id = int(cid)
+                    else:
+                        channel_id = self.repo.get_or_create_channel(name)
+                        it_name.setData(Qt.UserRole, channel_id)
+
+                    col = 1
+                    for m in range(1, 13):
+                        prices.append((m, channel_id, parse(get_item(r, col)), parse(get_item(r, col + 1))))
+                        col += 2
+            finally:
+                tbl.blockSignals(prev_block)
+                tbl.setSortingEnabled(True)
+
+            # 12 x kanal ayrı commit yerine tek transaction
+            self.repo.upsert_channel_prices_many(year, prices, adv_name)
             self.repo.set_meta("price_year", str(year))
             self.repo.set_meta("price_advertiser", adv_name)
             self.repo.upsert_advertiser(adv_name)
             QMessageBox.information(self, "Tamam", "Fiyatlar kaydedildi.")
+            self._mark_channels_dirty()
             self.refresh_channel_combo()
+            self.refresh_reservation_channel_filter()
             self.refresh_advertiser_combo()
         except Exception as e:
             QMessageBox.critical(self, "Hata", f"Kayıt sırasında hata: {e}")
@@ -3737,13 +4134,43 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            self.repo.get_or_create_channel(name)
-            self.refresh_price_channel_tab()
+            cid = self.repo.get_or_create_channel(name)
+            self._append_price_channel_row(cid, name)
+            self._mark_channels_dirty()
             self.refresh_channel_combo()
+            self.refresh_reservation_channel_filter()
             self.refresh_advertiser_combo()
         except Exception as e:
             QMessageBox.critical(self, "Hata", f"Kanal eklenemedi: {e}")
 
+    def _append_price_channel_row(self, cid: int, name: str) -> None:
+        """Yeni/yeniden aktifleşen kanalı fiyat tablosuna tek satır olarak ekler."""
+        tbl = self.price_table
+        for r in range(tbl.rowCount()):
+            it = tbl.item(r, 0)
+            if it is not None and it.data(Qt.UserRole) == cid:
+                tbl.setCurrentCell(r, 0)
+                return
+
+        # Pasiften geri gelen kanalın kayıtlı fiyatları olabilir
+        year = int(self.price_year.value())
+        adv_name = (self.price_advertiser.currentText() or "").strip()
+        month_prices = self.repo.get_channel_prices_by_channel(year, adv_name).get(cid, _NO_PRICES)
+
+        tbl.setSortingEnabled(False)
+        prev_block = tbl.blockSignals(True)
+        try:
+            r = tbl.rowCount()
+            tbl.insertRow(r)
+            self._fill_price_row(r, cid, name, month_prices)
+        finally:
+            tbl.blockSignals(prev_block)
+            tbl.setSortingEnabled(True)
+        try:
+            tbl.sortItems(0, Qt.AscendingOrder)
+        except Exception:
+            pass
+
     def delete_selected_channel(self) -> None:
         if not self.repo:
             QMessageBox.warning(self, "Hata", "DB bağlantısı yok.")
@@ -3776,8 +4203,11 @@ class MainWindow(QMainWindow):
 
         try:
             self.repo.deactivate_channel(int(cid))
-            self.refresh_price_channel_tab()
+            # Sadece bu satırı kaldır; tabloyu DB'den baştan kurma (kaydedilmemiş hücreler de korunur)
+            self.price_table.removeRow(r)
+            self._mark_channels_dirty()
             self.refresh_channel_combo()
+            self.refresh_reservation_channel_filter()
             self.refresh_advertiser_combo()
         except Exception as e:
             QMessageBox.critical(self, "Hata", f"Silinemedi: {e}")
@@ -3807,6 +4237,7 @@ class MainWindow(QMainWindow):
 
         self.btn_access_save = QPushButton("Kaydet")
         top.addWidget(self.btn_access_save)
+        self._update_access_save_enabled()
 
         btns = QHBoxLayout()
         layout.addLayout(btns)
@@ -3819,12 +4250,15 @@ class MainWindow(QMainWindow):
         btns.addWidget(self.btn_access_paste)
         btns.addStretch(1)
 
-        self.access_table = QTableWidget()
+        self.access_table = PasteRequestTableWidget()
         self.access_table.setAlternatingRowColors(True)
         self.access_table.setSortingEnabled(True)
         self.access_table.horizontalHeader().setSortIndicatorShown(True)
         self.access_table.horizontalHeader().setSectionsClickable(True)
         self.access_table.verticalHeader().setVisible(False)
+        # Değer hücreleri için ortalanmış şablon item (hücre başına setTextAlignment yerine clone)
+        self._access_value_proto = QTableWidgetItem()
+        self._access_value_proto.setTextAlignment(Qt.AlignCenter)
 
         # Varsayılan saat kolonları (Excel örneğiyle aynı)
         self._access_hours = ['07:00-08:00',
@@ -3851,7 +4285,7 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.access_table, 1)
 
         # Ctrl+V doğrudan tabloda çalışsın
-        self.access_table.installEventFilter(self)
+        self.access_table.pasteRequested.connect(self.access_paste_from_clipboard)
 
         # events
         self.btn_access_add.clicked.connect(self.access_add_row)
@@ -3891,44 +4325,126 @@ class MainWindow(QMainWindow):
                 year=year, label=label, periods=periods, targets=targets, hours=self._access_hours
             )
 
-        def _to_float(item: QTableWidgetItem | None):
-            t = (item.text() or "").strip() if item else ""
+        def _to_float(t: str):
             if not t:
                 return None
             try:
-                return float(t.replace(",", "."))
+                return float(t.translate(_COMMA_TO_DOT))
             except Exception:
                 return None
 
+        hour_keys = [str(h) for h in self._access_hours]
         rows: list[dict] = []
-        for r in range(self.access_table.rowCount()):
-            ch_item = self.access_table.item(r, 0)
-            ch = (ch_item.text().strip() if ch_item else "")
+        for cells in self._snapshot_access():
+            ch = cells[0]
             if not ch:
                 continue
 
             values: dict = { }
-            for i, hour in enumerate(self._access_hours, start=1):
-                v = _to_float(self.access_table.item(r, i))
+            for hour, t in zip(hour_keys, cells[1:]):
+                v = _to_float(t)
                 # boş hücreleri yazmaya gerek yok (DB şişmesin)
                 if v is None:
                     continue
-                values[str(hour)] = v
+                values[hour] = v
 
             rows.append({"channel": ch, "values": values})
 
-        self.repo.save_access_set(
+        # get_or_create_access_set commit etmez (önceden aynı bağlantıda save_access_set ediyordu);
+        # GUI bağlantısında açık yazım kalırsa worker bağlantısı kilide takılır.
+        if self.repo.conn.in_transaction:
+            self.repo.conn.commit()
+
+        # DB yazımı QThreadPool'da; sonuç _on_access_save_* ile GUI thread'de gösterilir
+        worker = AccessSaveWorker(
+            self._db_path,
             int(self._access_set_id),
             periods=periods,
             targets=targets,
             hours=self._access_hours,
             rows=rows,
         )
-        QMessageBox.information(self, "OK", "Erişim örneği DB'ye kaydedildi. Uygulama yeniden açılınca aynen gelecektir.")
+        # Sinyal nesnesi iş bitene kadar yaşamalı
+        self._access_save_signals = worker.signals
+        worker.signals.finished.connect(self._on_access_save_finished)
+        worker.signals.failed.connect(self._on_access_save_failed)
+        self._update_access_save_enabled()
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_access_save_finished(self) -> None:
+        self._access_save_signals = None
+        self._update_access_save_enabled()
+        # Modal kutu yerine durum çubuğu: art arda kaydetmede UI beklemesin
+        self.statusBar().showMessage("Erişim örneği DB'ye kaydedildi.", 3000)
+
+    def _on_access_save_failed(self, message: str) -> None:
+        self._access_save_signals = None
+        self._update_access_save_enabled()
+        QMessageBox.critical(self, "Hata", f"Erişim örneği kaydedilemedi:\n{message}")
 
     def access_save_db(self) -> None:
         self.access_save()
 
+    def _snapshot_access(self) -> list[tuple[str, ...]]:
+        """Erişim tablosunu tek geçişte (satır başına kolon sayısı kadar item() ile) metne çevirir.
+
+        Hücre metinleri strip edilmiş döner; item yoksa "".
+        """
+        tbl = self.access_table
+        get_item = tbl.item
+        cols = range(tbl.columnCount())
+        return [
+            tuple((it.text() or "").strip() if (it := get_item(r, c)) else "" for c in cols)
+            for r in range(tbl.rowCount())
+        ]
+
+    def _access_bulk_update(self, fn) -> None:
+        """fn'i erişim tablosunda repaint, sıralama ve sinyaller kapalıyken çalıştırır.
+
+        Sıralama açıkken her setItem satırları yeniden dizer (yazılan satır kayar); tek
+        seferde doldurup sonda bir kez çizdiriyoruz.
+        """
+        tbl = self.access_table
+        sorting = tbl.isSortingEnabled()
+        tbl.setUpdatesEnabled(False)
+        tbl.setSortingEnabled(False)
+        prev_block = tbl.blockSignals(True)
+        try:
+            fn()
+        finally:
+            tbl.blockSignals(prev_block)
+            tbl.setSortingEnabled(sorting)
+            tbl.setUpdatesEnabled(True)
+            tbl.viewport().update()
+
+    def _set_access_text(self, r: int, c: int, text: str) -> None:
+        """Erişim hücresine yazar: hücrede item varsa metni değişir, yoksa bir kez oluşturulur."""
+        it = self.access_table.item(r, c)
+        if it is not None:
+            it.setText(text)
+            return
+        if c:
+            it = self._access_value_proto.clone()
+            it.setText(text)
+        else:
+            it = QTableWidgetItem(text)
+        self.access_table.setItem(r, c, it)
+
+    def _access_known_channels(self) -> set[str]:
+        """Tablodaki ve DB'deki aktif kanal adları (büyük harf); başlık satırı tespiti için."""
+        names: set[str] = set()
+        tbl = self.access_table
+        for r in range(tbl.rowCount()):
+            it = tbl.item(r, 0)
+            if it and it.text().strip():
+                names.add(it.text().strip().upper())
+        try:
+            if self.repo:
+                names.update(str(ch["name"]).strip().upper() for ch in self.repo.list_channels(active_only=True))
+        except Exception:
+            pass
+        return names
+
     def access_paste_from_clipboard(self) -> None:
         """Excel'den kopyalanan saatlik erişim tablosunu yapıştırır.
         Beklenen format: ilk kolon kanal adı, sonraki kolonlar saatlik değerler.
@@ -3939,8 +4455,38 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "Uyarı", "Panoda veri yok. Excel'de alanı kopyalayıp tekrar dene.")
                 return
 
-            lines = [ln for ln in text.splitlines() if ln.strip()]
-            if not lines:
+            # Önce metni tamamen ayrıştır (Qt'ye dokunmadan), sonra tabloya yaz
+            n_hours = len(self._access_hours)
+            parsed: list[tuple[str, list[str]]] = []
+            header_skipped = ""
+            for ln in text.splitlines():
+                # fazla kolonlar yazılmayacak; gereğinden fazla bölme
+                cols = ln.split("\t", n_hours + 1)
+                first = cols[0].strip()
+                if not first:
+                    continue
+                # Header satırıysa atla
+                if first.lower() in ("channels", "channel", "kanal", "kanallar"):
+                    continue
+                vals = [c.strip() for c in cols[1 : n_hours + 1]]
+                # İlk satırın başlığı farklı yazılmış olabilir (yerel Excel): değerleri dolu
+                # ama hiçbiri sayı değilse (saat etiketleri gibi) başlık say. Değerleri "-" /
+                # "n/a" olan gerçek kanal satırı atılmasın: ilk kolon bilinen bir kanal ise veri.
+                if (
+                    not parsed
+                    and not header_skipped
+                    and any(vals)
+                    and not any(map(_looks_numeric, vals))
+                    and not _looks_numeric(first)
+                    and first.upper() not in self._access_known_channels()
+                ):
+                    header_skipped = first
+                    continue
+                if len(vals) < n_hours:
+                    vals.extend([""] * (n_hours - len(vals)))
+                parsed.append((first, vals))
+
+            if not parsed:
                 QMessageBox.warning(self, "Uyarı", "Panoda geçerli satır yok.")
                 return
 
@@ -3949,69 +4495,26 @@ class MainWindow(QMainWindow):
             if start_row < 0:
                 start_row = 0
 
-            r = start_row
-            for ln in lines:
-                cols = ln.split("\t")
-                if not cols:
-                    continue
-
-                first = (cols[0] or "").strip()
-                if not first:
-                    continue
-
-                # Header satırıysa atla
-                if first.lower() in ("channels", "channel", "kanal", "kanallar"):
-                    continue
-
-                if r >= self.access_table.rowCount():
-                    self.access_table.insertRow(r)
+            def _fill() -> None:
+                need = start_row + len(parsed)
+                if need > self.access_table.rowCount():
+                    self.access_table.setRowCount(need)
 
-                # Kanal adı
-                self.access_table.setItem(r, 0, QTableWidgetItem(first))
+                set_text = self._set_access_text
+                for r, (first, vals) in enumerate(parsed, start=start_row):
+                    # Kanal adı
+                    set_text(r, 0, first)
+                    # Saatlik değerler
+                    for i, val in enumerate(vals, start=1):
+                        set_text(r, i, val)
 
-                # Saatlik değerler
-                for i in range(1, 1 + len(self._access_hours)):
-                    val = cols[i].strip() if i < len(cols) else ""
-                    it = QTableWidgetItem(val)
-                    it.setTextAlignment(Qt.AlignCenter)
-                    self.access_table.setItem(r, i, it)
-
-                r += 1
+            self._access_bulk_update(_fill)
+            if header_skipped:
+                self.statusBar().showMessage(f"İlk satır başlık sayılıp atlandı: {header_skipped}", 5000)
 
         except Exception as e:
             QMessageBox.critical(self, "Hata", f"Yapıştırma başarısız: {e}")
 
-    def norm_num(s: str) -> str:
-        s = (s or "").strip()
-        # 52,47 -> 52.47
-        s = s.replace(".", "") if s.count(".") > 0 and s.count(",") == 1 else s
-        s = s.replace(",", ".")
-        return s
-
-        for i, ln in enumerate(lines):
-            parts = ln.split("\t")
-            # Beklenen: Channels | Universe | AvRch(000) | AvRch%
-            while len(parts) < 4:
-                parts.append("")
-
-            r = start_row + i
-            ch = parts[0].strip()
-            uni = parts[1].strip()
-            av0 = parts[2].strip()
-            avp = parts[3].strip()
-
-            self._set_access_cell(r, 0, ch, align_left=True)
-            self._set_access_cell(r, 1, norm_num(uni), center=True)
-            self._set_access_cell(r, 2, norm_num(av0), center=True)
-            self._set_access_cell(r, 3, norm_num(avp), center=True)
-
-    def eventFilter(self, obj, event):
-        if obj is getattr(self, "access_table", None) and event.type() == QEvent.KeyPress:
-            if event.matches(QKeySequence.Paste):
-                self.access_paste_from_clipboard()
-                return True
-        return super().eventFilter(obj, event)
-
     def access_save_to_file(self) -> None:
         try:
             data_dir = self.app_settings.data_dir
@@ -4021,21 +4524,11 @@ class MainWindow(QMainWindow):
             dates = (self.access_dates.text() or "").strip()
             targets = (self.access_targets.text() or "").strip()
 
-            rows = []
-            for r in range(self.access_table.rowCount()):
-                ch = self.access_table.item(r, 0).text().strip() if self.access_table.item(r, 0) else ""
-                if not ch:
-                    continue
-
-                def get(col):
-                    return self.access_table.item(r, col).text().strip() if self.access_table.item(r, col) else ""
-
-                rows.append({
-                    "channel": ch,
-                    "universe": get(1),
-                    "avrch000": get(2),
-                    "avrch_pct": get(3),
-                })
+            rows = [
+                {"channel": ch, "universe": uni, "avrch000": av0, "avrch_pct": avp}
+                for ch, uni, av0, avp in ((*cells, "", "", "")[:4] for cells in self._snapshot_access())
+                if ch
+            ]
 
             payload = {
                 "dates": dates,
@@ -4044,7 +4537,7 @@ class MainWindow(QMainWindow):
             }
 
             path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-            QMessageBox.information(self, "OK", "Erişim örneği kaydedildi (access_example.json).")
+            self.statusBar().showMessage("Erişim örneği kaydedildi (access_example.json).", 3000)
 
         except Exception as e:
             QMessageBox.critical(self, "Hata", f"Kaydetme hatası: {e}")
@@ -4068,21 +4561,25 @@ class MainWindow(QMainWindow):
             self.access_targets.setText(payload.get("targets", ""))
 
             rows = payload.get("rows", []) or []
-            self.access_table.setRowCount(max(len(rows), 30))
 
-            for i, r in enumerate(rows):
-                self.access_table.setItem(i, 0, QTableWidgetItem(str(r.get("channel",""))))
-                self.access_table.setItem(i, 1, QTableWidgetItem(str(r.get("universe",""))))
-                self.access_table.setItem(i, 2, QTableWidgetItem(str(r.get("avrch000",""))))
-                self.access_table.setItem(i, 3, QTableWidgetItem(str(r.get("avrch_pct",""))))
-                for c in (1,2,3):
-                    self.access_table.item(i,c).setTextAlignment(Qt.AlignCenter)
+            def _fill() -> None:
+                self.access_table.setRowCount(max(len(rows), 30))
+
+                proto = self._access_value_proto
+                for i, r in enumerate(rows):
+                    self.access_table.setItem(i, 0, QTableWidgetItem(str(r.get("channel",""))))
+                    for c, key in ((1, "universe"), (2, "avrch000"), (3, "avrch_pct")):
+                        it = proto.clone()
+                        it.setText(str(r.get(key,"")))
+                        self.access_table.setItem(i, c, it)
+
+            self._access_bulk_update(_fill)
 
         except Exception as e:
             QMessageBox.critical(self, "Hata", f"Erişim verisi okunamadı: {e}")
             self.access_table.setRowCount(30)
     def _parse_year_from_dates(self, dates: str) -> int:
-        m = re.search(r"(19\d{2}|20\d{2})", dates or "")
+        m = _YEAR_RE.search(dates or "")
         return int(m.group(1)) if m else datetime.now().year
 
     def _set_access_table_hours(self, hours: list[str]) -> None:
@@ -4132,35 +4629,40 @@ class MainWindow(QMainWindow):
         if hours:
             self._set_access_table_hours(hours)
 
-        self.access_table.setRowCount(max(len(rows), 30))
-
         def _norm_hour(s: str) -> str:
-            return re.sub(r"\([^\)]*\)\s*$", "", (s or "").strip())
+            return _HOUR_SUFFIX_RE.sub("", (s or "").strip())
 
-        for i, r in enumerate(rows):
-            self.access_table.setItem(i, 0, QTableWidgetItem(str(r.get("channel", ""))))
+        proto = self._access_value_proto
 
-            vals = r.get("values") or {}
-            # normalize map for fallback
-            norm_map = {}
-            for k, v in vals.items():
-                norm_map[_norm_hour(str(k))] = v
+        def _fill() -> None:
+            self.access_table.setRowCount(max(len(rows), 30))
 
-            for col_idx, hour in enumerate(self._access_hours, start=1):
-                v = None
-                if str(hour) in vals:
-                    v = vals.get(str(hour))
-                else:
-                    v = norm_map.get(_norm_hour(str(hour)))
+            for i, r in enumerate(rows):
+                self.access_table.setItem(i, 0, QTableWidgetItem(str(r.get("channel", ""))))
+
+                vals = r.get("values") or {}
+                # normalize map for fallback
+                norm_map = {}
+                for k, v in vals.items():
+                    norm_map[_norm_hour(str(k))] = v
+
+                for col_idx, hour in enumerate(self._access_hours, start=1):
+                    v = None
+                    if str(hour) in vals:
+                        v = vals.get(str(hour))
+                    else:
+                        v = norm_map.get(_norm_hour(str(hour)))
 
-                it = QTableWidgetItem("" if v is None else str(v))
-                if v is not None:
-                    try:
-                        it.setData(Qt.EditRole, float(v))
-                    except Exception:
-                        pass
-                it.setTextAlignment(Qt.AlignCenter)
-                self.access_table.setItem(i, col_idx, it)
+                    it = proto.clone()
+                    it.setText("" if v is None else str(v))
+                    if v is not None:
+                        try:
+                            it.setData(Qt.EditRole, float(v))
+                        except Exception:
+                            pass
+                    self.access_table.setItem(i, col_idx, it)
+
+        self._access_bulk_update(_fill)
 
         try:
             self.access_table.sortItems(0, Qt.AscendingOrder)
@@ -133,6 +133,9 @@ class PlanningGrid(QWidget):
         self.table.horizontalHeader().setMinimumSectionSize(self._day_col_min)
         self.table.itemChanged.connect(self._on_item_changed)
 
+        # get_matrix() sonucu; grid değişmedikçe tekrar taranmaz (bkz. _invalidate_matrix_cache)
+        self._matrix_cache: dict[str, str] | None = None
+
         # Recalc debounce (UI takılmalarını azaltır)
         self._recalc_pending = False
         self._recalc_delay_ms = 60
@@ -276,6 +279,8 @@ class PlanningGrid(QWidget):
 
     def _schedule_recalc(self) -> None:
         """Coalesce frequent UI changes into a single recalculation."""
+        # Hücreler sinyal bloklu yazılmış olabilir (itemChanged gelmez); get_matrix eskiyi dönmesin
+        self._matrix_cache = None
         if self._suspend_calc or self._in_calc_refresh:
             return
         if getattr(self, '_recalc_pending', False):
@@ -291,7 +296,11 @@ class PlanningGrid(QWidget):
         self._recalc_pending = False
         self._recalc_all_metrics()
 
+    def _invalidate_matrix_cache(self) -> None:
+        self._matrix_cache = None
+
     def _on_item_changed(self, item: QTableWidgetItem) -> None:
+        self._matrix_cache = None
         if self._suspend_calc or self._in_calc_refresh or item is None:
             return
         try:
@@ -669,6 +678,7 @@ class PlanningGrid(QWidget):
 
     def clear_matrix(self) -> None:
         """Sadece gün hücrelerini temizle."""
+        self._invalidate_matrix_cache()
         if self._mode == "span":
             day_count = len(self._span_dates)
             for r in range(self._data_row_count()):
@@ -697,6 +707,7 @@ class PlanningGrid(QWidget):
         # Backward compatible entry point.
         # - month mode: expects row,day keys for the current month
         # - span mode: we treat given matrix as belonging to the span start month
+        self._invalidate_matrix_cache()
         if self._mode == "span":
             self.set_span_month_matrices({(self.year, self.month): (plan_cells or {})})
             return
@@ -782,6 +793,7 @@ class PlanningGrid(QWidget):
             self.table.blockSignals(prev_block)
 
     def set_month(self, year: int, month: int, selected_day: int | None):
+        self._invalidate_matrix_cache()
         self._mode = "month"
         self._span_dates = []
         self._span_start = None
@@ -908,6 +920,7 @@ class PlanningGrid(QWidget):
         Internally still uses day numbers per month. Higher layers can split
         the grid into per-month matrices via get_span_month_matrices().
         """
+        self._invalidate_matrix_cache()
         if start and end and start > end:
             start, end = end, start
 
@@ -1043,6 +1056,33 @@ class PlanningGrid(QWidget):
             it.setFont(f)
             it.setBackground(QBrush(QColor("#d0d0d0")))
 
+    def highlight_day(self, day: int | None) -> None:
+        """Month modunda sadece seçili gün başlığını değiştir (grid yeniden kurulmaz)."""
+        if self._mode != "month":
+            return
+        days_in_month = calendar.monthrange(self.year, self.month)[1]
+        if day == self.selected_day:
+            return
+        base_font = self.table.horizontalHeader().font()
+
+        old_day = self.selected_day
+        if old_day and 1 <= old_day <= days_in_month:
+            it = self.table.horizontalHeaderItem(2 + old_day)
+            if it:
+                f = QFont(base_font)
+                f.setBold(False)
+                it.setFont(f)
+                it.setBackground(QBrush())
+
+        self.selected_day = day
+        if day and 1 <= day <= days_in_month:
+            it = self.table.horizontalHeaderItem(2 + day)
+            if it:
+                f = QFont(base_font)
+                f.setBold(True)
+                it.setFont(f)
+                it.setBackground(QBrush(QColor("#d0d0d0")))
+
     def set_selected_date(self, d: date | None) -> None:
         """Update header highlight only."""
         if self._mode != "span":
@@ -1050,8 +1090,7 @@ class PlanningGrid(QWidget):
             if d is None:
                 return
             if d.year == self.year and d.month == self.month:
-                self.selected_day = d.day
-                self.set_month(self.year, self.month, self.selected_day)
+                self.highlight_day(d.day)
             return
         if d and d in self._span_dates:
             self._selected_date = d
@@ -1080,6 +1119,7 @@ class PlanningGrid(QWidget):
 
     def set_span_month_matrices(self, month_mats: dict[tuple[int, int], dict]) -> None:
         """Populate span grid from per-month matrices."""
+        self._invalidate_matrix_cache()
         if self._mode != "span" or not self._span_dates:
             # treat as month mode
             self.set_matrix((month_mats or {}).get((self.year, self.month), {}))
@@ -1121,6 +1161,10 @@ class PlanningGrid(QWidget):
             mm = self.get_span_month_matrices().get((self.year, self.month), {})
             return dict(mm)
 
+        # Grid değişmediyse (itemChanged/set_* gelmediyse) önceki taramayı kullan
+        if self._matrix_cache is not None:
+            return dict(self._matrix_cache)
+
         out: dict[str, str] = {}
         days_in_month = calendar.monthrange(self.year, self.month)[1]
         for r in range(self._data_row_count()):
@@ -1132,4 +1176,5 @@ class PlanningGrid(QWidget):
                 v = it.text().strip()
                 if v:
                     out[f"{r},{day}"] = v   # <-- JSON safe
-        return out
+        self._matrix_cache = out
+        return dict(out)
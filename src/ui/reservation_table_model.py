@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+def _plan_date_text(r: Any, p: dict) -> str:
+    if bool(p.get("is_span")) and p.get("span_start") and p.get("span_end"):
+        return f"{p.get('span_start')} - {p.get('span_end')}"
+    return str(p.get("plan_date") or "")
+
+
+# (başlık, kayıt + payload -> hücre metni)
+COLUMNS: tuple[tuple[str, Callable[[Any, dict], str]], ...] = (
+    ("Rezervasyon No", lambda r, p: str(r.reservation_no or "")),
+    ("Plan Başlığı", lambda r, p: str(p.get("plan_title") or "")),
+    ("Plan Tarihi", _plan_date_text),
+    ("Kanal", lambda r, p: str(p.get("channel_name") or "")),
+    ("Spot Kodu", lambda r, p: str(p.get("spot_code") or "")),
+    ("Süre (sn)", lambda r, p: str(p.get("spot_duration_sec") or "")),
+    ("Adet", lambda r, p: str(p.get("adet_total") or "")),
+    ("Kayıt Zamanı", lambda r, p: str(r.created_at or "")),
+)
+
+
+class ReservationTableModel(QAbstractTableModel):
+    """REZERVASYONLAR listesi için salt-okunur model.
+
+    Hücre metinleri set_records'ta sütun başına düz str listesi olarak (SoA) bir kez
+    üretilir; data() sadece liste indekslemesi yapar. Hücre başı QTableWidgetItem yoktur
+    (50 bin satırda 400 bin nesne kurulmaz), repaint/scroll payload'a tekrar inmez.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._records: list = []
+        self._cols: list[list[str]] = [[] for _ in COLUMNS]
+
+    def set_records(self, records: list) -> None:
+        payloads = [r.payload or {} for r in records]
+        cols = [[fn(r, p) for r, p in zip(records, payloads)] for _, fn in COLUMNS]
+        self.beginResetModel()
+        self._records = records
+        self._cols = cols
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._records)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self._cols[index.column()][index.row()]
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(COLUMNS):
+            return COLUMNS[section][0]
+        return None
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from src.storage.db import ensure_data_folders, connect_db, migrate_and_seed
+from src.storage.repository import Repository
+
+
+class StorageBootstrapSignals(QObject):
+    """Worker thread -> GUI thread bildirimleri (queued connection)."""
+
+    ready = Signal(int, str)  # (istek no, db yolu)
+    failed = Signal(int, str)
+
+
+class StorageBootstrapWorker(QRunnable):
+    """Veri klasörünü hazırlar, DB'yi migrate/seed eder (ilk açılış UI'yi bekletmesin).
+
+    Not: sqlite bağlantısı açıldığı thread'e bağlıdır. Bu yüzden burada açılan bağlantı
+    iş bitince kapatılır; GUI thread hazır DB'ye kendi bağlantısını açar (hızlı).
+    """
+
+    def __init__(self, token: int, data_dir: Path) -> None:
+        super().__init__()
+        self.token = token
+        self.data_dir = Path(data_dir)
+        self.signals = StorageBootstrapSignals()
+
+    def run(self) -> None:
+        try:
+            ensure_data_folders(self.data_dir)
+            db_path = self.data_dir / "data.db"
+            conn = connect_db(db_path)
+            try:
+                migrate_and_seed(conn)
+            finally:
+                conn.close()
+        except Exception as e:
+            self.signals.failed.emit(self.token, str(e))
+            return
+        self.signals.ready.emit(self.token, str(db_path))
+
+
+class AccessSaveSignals(QObject):
+    """Worker thread -> GUI thread bildirimleri (queued connection)."""
+
+    finished = Signal()
+    failed = Signal(str)
+
+
+class AccessSaveWorker(QRunnable):
+    """Erişim örneği setini arka planda DB'ye yazar (büyük tabloda UI donmasın).
+
+    Tablo GUI thread'de düz Python verisine çevrilip buraya verilir. sqlite bağlantısı
+    thread'e bağlı olduğundan worker kendi bağlantısını açar ve iş bitince kapatır.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        set_id: int,
+        periods: str,
+        targets: str,
+        hours: list[str],
+        rows: list[dict],
+    ) -> None:
+        super().__init__()
+        self.db_path = Path(db_path)
+        self.set_id = int(set_id)
+        self.periods = periods
+        self.targets = targets
+        self.hours = list(hours)
+        self.rows = rows
+        self.signals = AccessSaveSignals()
+
+    def run(self) -> None:
+        try:
+            conn = connect_db(self.db_path)
+            try:
+                Repository(conn).save_access_set(
+                    self.set_id,
+                    periods=self.periods,
+                    targets=self.targets,
+                    hours=self.hours,
+                    rows=self.rows,
+                )
+            finally:
+                conn.close()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit()
+
+
+class QuerySignals(QObject):
+    """Worker thread -> GUI thread bildirimleri (queued connection)."""
+
+    ready = Signal(int, object)  # (istek no, sorgu sonucu)
+    failed = Signal(int, str)
+
+
+class QueryWorker(QRunnable):
+    """Salt-okunur bir Repository sorgusunu QThreadPool'da çalıştırır (UI donmasın).
+
+    fn, worker'ın kendi bağlantısıyla kurulan Repository'yi alır ve sonucu döner.
+    sqlite bağlantısı thread'e bağlı olduğundan bağlantı burada açılıp kapatılır.
+    Eski isteklerin sonuçları çağıran tarafta istek no ile elenir.
+    """
+
+    def __init__(self, token: int, db_path: Path, fn: Callable[[Repository], Any]) -> None:
+        super().__init__()
+        self.token = token
+        self.db_path = Path(db_path)
+        self.fn = fn
+        self.signals = QuerySignals()
+
+    def run(self) -> None:
+        try:
+            conn = connect_db(self.db_path)
+            try:
+                result = self.fn(Repository(conn))
+            finally:
+                conn.close()
+        except Exception as e:
+            self.signals.failed.emit(self.token, str(e))
+            return
+        self.signals.ready.emit(self.token, result)